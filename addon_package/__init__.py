@@ -1,15 +1,60 @@
 """Addon entry point for LikeCadSketch Blender add-on."""
 
-import bpy
 import importlib
 
-from .operators import line_tool
-from .operators import trim_tool
-from .ui import header as ui_header
+try:
+    import bpy
+except ImportError:
+    # Plain CPython (tests, benchmarks): only the bpy-free modules such as ``geom`` can be imported.
+    bpy = None
 
-# Force reload during development
-importlib.reload(line_tool)
-importlib.reload(trim_tool)
+if bpy is not None:
+    from . import geom
+    from .core import cells
+    from .core import cutting
+    from .core import draw_lists
+    from .core import edge_split
+    from .core import faces
+    from .core import frustum
+    from .core import mesh_arrays
+    from .core import mesh_sync
+    from .core import pick_grid
+    from .core import picking
+    from .core import profiling
+    from .core import redraw
+    from .core import segment_grid
+    from .core import snap_grid
+    from .core import snap_index
+    from .core import stroke
+    from .core import weld
+    from .operators import line_tool
+    from .operators import trim_tool
+    from .operators import weld_tool
+    from .ui import header as ui_header
+    from .ui import profile_panel as ui_profile_panel
+
+    # Force reload during development
+    importlib.reload(geom)
+    importlib.reload(cells)
+    importlib.reload(cutting)
+    importlib.reload(draw_lists)
+    importlib.reload(edge_split)
+    importlib.reload(faces)
+    importlib.reload(frustum)
+    importlib.reload(mesh_arrays)
+    importlib.reload(mesh_sync)
+    importlib.reload(pick_grid)
+    importlib.reload(picking)
+    importlib.reload(profiling)
+    importlib.reload(redraw)
+    importlib.reload(segment_grid)
+    importlib.reload(snap_grid)
+    importlib.reload(snap_index)
+    importlib.reload(stroke)
+    importlib.reload(weld)
+    importlib.reload(line_tool)
+    importlib.reload(trim_tool)
+    importlib.reload(weld_tool)
 
 bl_info = {
     "name": "Like CAD Sketch",
@@ -22,19 +67,23 @@ bl_info = {
 }
 
 
-classes = (
-    line_tool.VIEW3D_OT_cad_line,
-    trim_tool.VIEW3D_OT_cad_trim,
-)
+if bpy is not None:
+    classes = (
+        line_tool.VIEW3D_OT_cad_line,
+        trim_tool.VIEW3D_OT_cad_trim,
+        weld_tool.VIEW3D_OT_cad_weld,
+    )
 
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     ui_header.register()
+    ui_profile_panel.register()
 
 
 def unregister():
+    ui_profile_panel.unregister()
     ui_header.unregister()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -0,0 +1,21 @@
+"""Core data structures shared by LikeCadSketch operators."""
+
+__all__ = [
+    "cells",
+    "cutting",
+    "draw_lists",
+    "edge_split",
+    "faces",
+    "frustum",
+    "mesh_arrays",
+    "mesh_sync",
+    "pick_grid",
+    "picking",
+    "profiling",
+    "redraw",
+    "segment_grid",
+    "snap_grid",
+    "snap_index",
+    "stroke",
+    "weld",
+]
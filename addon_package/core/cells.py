@@ -0,0 +1,83 @@
+"""Integer cell keys shared by the sorted-key spatial grids.
+
+The grids bucket items into square or cubic cells and keep them sorted by a
+single int64 key per cell, last coordinate fastest, so the cells of one
+column (2D) or one (x, y) column (3D) form a contiguous run of keys that two
+``searchsorted`` calls find. World-space grids key their cells relative to
+the centre of their data (see ``cell_frame``), so neither coordinates far from
+the origin nor a small cell size push the cells against the key range.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+# Cell coordinates are clamped to these ranges so two or three of them fit in an int64 key.
+CELL_LIMIT_2D = 1 << 30
+CELL_LIMIT_3D = 1 << 20
+
+
+def _limit(dims: int) -> int:
+    return CELL_LIMIT_2D if dims == 2 else CELL_LIMIT_3D
+
+
+def cell_frame(points, cell_size: float) -> Tuple[np.ndarray, float]:
+    """``(origin, cell_size)`` to key ``(n, 2)`` or ``(n, 3)`` points with.
+
+    The origin is the centre of the points' bounding box, and the cell size
+    is grown past ``cell_size`` only as far as needed for the whole box, with
+    a few cells of margin, to fit the key range. Grids that check candidates
+    against the real distance stay exact with the larger cells.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    dims = points.shape[-1]
+    if not len(points):
+        return np.zeros(dims), cell_size
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    half = float((high - low).max()) / 2.0
+    return (low + high) / 2.0, max(cell_size, half / (_limit(dims) - 4))
+
+
+def cell_coords(points, cell_size: float, margin: int = 0, origin=None) -> np.ndarray:
+    """Integer cells of ``(n, 2)`` or ``(n, 3)`` points, clamped to the key range.
+
+    ``margin`` keeps that many cells of headroom at both ends, so neighbour
+    offsets up to ``margin`` still encode to valid keys. Cells are counted
+    from ``origin`` when given.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    limit = _limit(points.shape[-1])
+    if origin is not None:
+        points = points - origin
+    cells = np.floor(points / cell_size)
+    return np.clip(cells, -limit + margin, limit - 1 - margin).astype(np.int64)
+
+
+def encode(*cells):
+    """Key of the cell ``(cx, cy)`` or ``(cx, cy, cz)``; works on scalars and arrays alike."""
+    limit = _limit(len(cells))
+    key = 0
+    for c in cells:
+        key = key * (2 * limit) + (c + limit)
+    return key
+
+
+def in_range(span: int, *cells) -> bool:
+    """Whether every cell within ``span`` of the scalar cell ``cells`` has a valid key."""
+    limit = _limit(len(cells))
+    return all(-limit + span <= c < limit - span for c in cells)
+
+
+def key_range(keys: np.ndarray, first, last) -> Tuple[np.ndarray, np.ndarray]:
+    """``(lo, hi)`` such that ``keys[lo:hi]`` holds every key from ``first`` to ``last`` inclusive."""
+    return np.searchsorted(keys, first, side="left"), np.searchsorted(keys, last, side="right")
+
+
+def gather_ranges(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Concatenated ``arange(lo[i], hi[i])`` over all ``i`` without a Python loop."""
+    counts = hi - lo
+    return np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(int(counts.sum()))
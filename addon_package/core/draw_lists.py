@@ -0,0 +1,55 @@
+"""GPU-independent draw-list building for operator overlays."""
+
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .redraw import freeze
+
+Coord = Tuple[float, float, float]
+
+
+def line_preview_coords(start: Optional[Sequence[float]], end: Optional[Sequence[float]]) -> Optional[List[Coord]]:
+    """Return the ``LINES`` vertex list for the rubber-band segment, or ``None`` if there is none."""
+    if start is None or end is None:
+        return None
+    return [(start[0], start[1], start[2]), (end[0], end[1], end[2])]
+
+
+def stroke_preview_coords(
+    segments: Sequence[Tuple[Sequence[float], Sequence[float]]],
+    start: Optional[Sequence[float]],
+    end: Optional[Sequence[float]],
+) -> Optional[List[Coord]]:
+    """Return ``LINES`` vertices for the buffered ``(start, end)`` segments plus the rubber-band segment."""
+    coords: List[Coord] = []
+    for a, b in segments:
+        coords.append((a[0], a[1], a[2]))
+        coords.append((b[0], b[1], b[2]))
+    coords.extend(line_preview_coords(start, end) or ())
+    return coords or None
+
+
+class DrawListCache:
+    """Keeps the last draw list and rebuilds it only when the inputs change.
+
+    Inputs are compared by value, so mutable ``mathutils`` vectors can be passed
+    directly; tuples are taken as they are. ``update`` reports a rebuild, which
+    lets the caller drop GPU batches built from the older list.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, builder: Callable[..., Optional[List[Coord]]]):
+        self._builder = builder
+        self._key = self._UNSET
+        self.coords: Optional[List[Coord]] = None
+
+    def update(self, *inputs) -> bool:
+        """Rebuild the draw list if any input changed; return whether it did."""
+        key = tuple(freeze(value) for value in inputs)
+        if key == self._key:
+            return False
+        self._key = key
+        self.coords = self._builder(*inputs)
+        return True
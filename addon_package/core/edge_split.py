@@ -0,0 +1,35 @@
+"""Splitting bmesh edges at given parameters."""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+import bmesh
+
+
+def split_edge(edge, factors: Sequence[float]) -> Tuple[List, List]:
+    """Cut ``edge`` at strictly increasing ``factors`` in (0, 1), measured from ``edge.verts[0]``.
+
+    Returns ``(verts, segments)``: the new vertices in order from
+    ``edge.verts[0]`` and the ``len(factors) + 1`` edges between them, in the
+    same order. Each cut is one ``bmesh.utils.edge_split`` on the remaining
+    piece, so the cost is linear in the number of cuts.
+    """
+    v_from = edge.verts[0]
+    current = edge
+    done = 0.0
+    verts = []
+    segments = []
+    for factor in factors:
+        new_edge, new_vert = bmesh.utils.edge_split(current, v_from, (factor - done) / (1.0 - done))
+        # One of the two pieces still touches ``v_from``; the other carries the remaining cuts.
+        if v_from in new_edge.verts:
+            segments.append(new_edge)
+        else:
+            segments.append(current)
+            current = new_edge
+        verts.append(new_vert)
+        v_from = new_vert
+        done = factor
+    segments.append(current)
+    return verts, segments
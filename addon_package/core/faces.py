@@ -0,0 +1,119 @@
+"""Incremental face creation for loops closed by newly drawn edges."""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+import bmesh
+
+
+# A loop walk gives up after this many vertices.
+MAX_LOOP_VERTS = 1024
+
+# Vertices farther than this from the loop plane, in object space, are not part of the loop.
+DEFAULT_TOLERANCE = 1e-4
+
+
+def _next_vert(prev, cur, origin, normal, tolerance):
+    """The in-plane neighbour of ``cur`` reached by the sharpest left turn coming from ``prev``."""
+    incoming = cur.co - prev.co
+    best = None
+    best_turn = -math.inf
+    for edge in cur.link_edges:
+        vert = edge.other_vert(cur)
+        if vert is prev or abs(normal.dot(vert.co - origin)) > tolerance:
+            continue
+        outgoing = vert.co - cur.co
+        if outgoing.length_squared == 0.0:
+            continue
+        turn = math.atan2(normal.dot(incoming.cross(outgoing)), incoming.dot(outgoing))
+        if turn > best_turn:
+            best_turn = turn
+            best = vert
+    return best
+
+
+def trace_loop(v_start, v_next, normal, tolerance: float = DEFAULT_TOLERANCE,
+               max_verts: int = MAX_LOOP_VERTS) -> Optional[List]:
+    """Walk the smallest loop to the left of ``v_start`` -> ``v_next`` in the plane of ``normal``.
+
+    Returns the loop vertices counter-clockwise around ``normal``, or ``None``
+    if the walk dead-ends, leaves the plane, repeats a vertex or only closes
+    around the outside of the drawing. The cost is proportional to the loop
+    length times the vertex valence, independent of the mesh size.
+    """
+    origin = v_start.co
+    loop = [v_start, v_next]
+    visited = {v_start, v_next}
+    while len(loop) <= max_verts:
+        vert = _next_vert(loop[-2], loop[-1], origin, normal, tolerance)
+        if vert is None:
+            return None
+        if vert is v_start:
+            break
+        if vert in visited:
+            return None
+        loop.append(vert)
+        visited.add(vert)
+    else:
+        return None
+
+    if len(loop) < 3:
+        return None
+    area = sum(
+        (normal.dot((a.co - origin).cross(b.co - origin)) for a, b in zip(loop[1:], loop[2:])),
+        0.0,
+    )
+    return loop if area > 0.0 else None
+
+
+def planar_loops(edge, tolerance: float = DEFAULT_TOLERANCE, max_verts: int = MAX_LOOP_VERTS) -> List[List]:
+    """Return the distinct closed planar loops through ``edge``, one per side and plane."""
+    v_a, v_b = edge.verts
+    direction = v_b.co - v_a.co
+    loops = []
+    seen = set()
+    for vert in (v_a, v_b):
+        for other in vert.link_edges:
+            if other is edge:
+                continue
+            normal = direction.cross(other.other_vert(vert).co - vert.co)
+            if normal.length_squared <= tolerance * tolerance * direction.length_squared:
+                continue
+            normal.normalize()
+            for side in (normal, -normal):
+                loop = trace_loop(v_a, v_b, side, tolerance, max_verts)
+                if loop is None:
+                    continue
+                key = frozenset(loop)
+                if key not in seen:
+                    seen.add(key)
+                    loops.append(loop)
+    return loops
+
+
+def fill_loops(bm, edges, tolerance: float = DEFAULT_TOLERANCE, max_verts: int = MAX_LOOP_VERTS) -> int:
+    """Create faces for the loops that ``edges`` close; return how many faces were added.
+
+    An edge across an existing face splits that face instead. Loops that
+    already have a face are left alone.
+    """
+    created = 0
+    for edge in edges:
+        if not edge.is_valid or len(edge.link_faces) >= 2:
+            continue
+        v_a, v_b = edge.verts
+        shared = [
+            face for face in set(v_a.link_faces) & set(v_b.link_faces)
+            if edge not in face.edges and abs(face.normal.dot(v_b.co - v_a.co)) <= tolerance
+        ]
+        if shared:
+            bmesh.utils.face_split(shared[0], v_a, v_b, use_exist=True)
+            created += 1
+            continue
+        for loop in planar_loops(edge, tolerance, max_verts):
+            if bm.faces.get(loop) is None:
+                bm.faces.new(loop)
+                created += 1
+    return created
@@ -0,0 +1,42 @@
+"""Batched view-frustum tests for snap candidates."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def box_corners(mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """Return the ``(n, 8, 3)`` corners of axis-aligned boxes given by ``(n, 3)`` bounds."""
+    return np.stack(
+        [
+            np.stack((xs[:, 0], ys[:, 1], zs[:, 2]), axis=1)
+            for xs in (mins, maxs)
+            for ys in (mins, maxs)
+            for zs in (mins, maxs)
+        ],
+        axis=1,
+    )
+
+
+def boxes_in_frustum(mins: np.ndarray, maxs: np.ndarray, matrix, margin_x: float = 0.0, margin_y: float = 0.0) -> np.ndarray:
+    """Return a mask of the axis-aligned boxes that may project inside the region.
+
+    ``mins`` and ``maxs`` are ``(n, 3)`` box corners and ``matrix`` maps them to
+    clip space. The region is widened by ``margin_x``/``margin_y`` in normalised
+    device units. A box is rejected only when all eight corners lie behind the
+    view or beyond the same side of the region, so the test is conservative.
+    """
+    m = np.asarray(matrix, dtype=np.float32)
+    clip = box_corners(mins, maxs) @ m[:, :3].T + m[:, 3]
+    x, y, w = clip[..., 0], clip[..., 1], clip[..., 3]
+    kx = 1.0 + margin_x
+    ky = 1.0 + margin_y
+
+    outside = (
+        (w <= 0.0).all(axis=1)
+        | (x < -kx * w).all(axis=1)
+        | (x > kx * w).all(axis=1)
+        | (y < -ky * w).all(axis=1)
+        | (y > ky * w).all(axis=1)
+    )
+    return ~outside
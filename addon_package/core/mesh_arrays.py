@@ -0,0 +1,44 @@
+"""Bulk reads of mesh data into NumPy arrays."""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def read_vertex_arrays(mesh) -> Tuple[np.ndarray, np.ndarray]:
+    """Return local vertex coordinates ``(n, 3)`` and hide flags ``(n,)`` of ``mesh``."""
+    count = len(mesh.vertices)
+    co = np.empty(count * 3, dtype=np.float32)
+    hide = np.empty(count, dtype=bool)
+    mesh.vertices.foreach_get("co", co)
+    mesh.vertices.foreach_get("hide", hide)
+    return co.reshape(count, 3), hide
+
+
+def read_edge_arrays(mesh) -> Tuple[np.ndarray, np.ndarray]:
+    """Return edge vertex indices ``(m, 2)`` and hide flags ``(m,)`` of ``mesh``."""
+    count = len(mesh.edges)
+    verts = np.empty(count * 2, dtype=np.int32)
+    hide = np.empty(count, dtype=bool)
+    mesh.edges.foreach_get("vertices", verts)
+    mesh.edges.foreach_get("hide", hide)
+    return verts.reshape(count, 2), hide
+
+
+def renumbered_rows(old_count: int, removed, added, new_count: int) -> np.ndarray:
+    """Map the rows of ``old_count`` elements to their rows after an edit; removed rows map to -1.
+
+    ``removed`` are old rows of the deleted elements and ``added`` the new rows
+    of the created ones. BMesh keeps the surviving elements in order but puts
+    new ones into slots freed by earlier deletions, so the survivors take the
+    new rows not used by ``added``, in order.
+    """
+    alive = np.ones(old_count, dtype=bool)
+    alive[np.asarray(removed, dtype=np.int64)] = False
+    free = np.ones(new_count, dtype=bool)
+    free[np.asarray(added, dtype=np.int64)] = False
+    mapping = np.full(old_count, -1, dtype=np.int64)
+    mapping[alive] = np.flatnonzero(free)
+    return mapping
@@ -0,0 +1,61 @@
+"""Dirty tracking for edit-mesh updates made by modal operators."""
+
+from __future__ import annotations
+
+import bmesh
+
+
+class EditMeshSync:
+    """Rebuilds bmesh lookup tables and pushes edit-mesh updates only after a change.
+
+    Operators call ``mark_geometry`` after adding or removing elements, with
+    ``faces=True`` if faces were added or reshaped so the tessellation is redone,
+    and ``mark_selection`` after changing selection flags. ``ensure_tables`` and
+    ``flush`` are cheap no-ops while nothing is dirty, so they can be called
+    from every event handler.
+    """
+
+    def __init__(self, bm, mesh):
+        self.bm = bm
+        self.mesh = mesh
+        self._tables_dirty = True
+        self._geometry_dirty = False
+        self._faces_dirty = False
+        self._selection_dirty = False
+        self.flushes = 0
+        self.skipped = 0
+
+    @property
+    def dirty(self) -> bool:
+        return self._geometry_dirty or self._selection_dirty
+
+    def mark_geometry(self, faces: bool = False):
+        self._tables_dirty = True
+        self._geometry_dirty = True
+        self._faces_dirty |= faces
+
+    def mark_selection(self):
+        self._selection_dirty = True
+
+    def ensure_tables(self):
+        """Make ``bm.verts[i]`` / ``bm.edges[i]`` valid if the topology changed."""
+        if not self._tables_dirty:
+            return
+        self.bm.verts.ensure_lookup_table()
+        self.bm.edges.ensure_lookup_table()
+        self._tables_dirty = False
+
+    def flush(self) -> bool:
+        """Push pending changes to the mesh; return whether an update was sent."""
+        if not self.dirty:
+            self.skipped += 1
+            return False
+        bmesh.update_edit_mesh(self.mesh, loop_triangles=self._faces_dirty, destructive=self._geometry_dirty)
+        self._geometry_dirty = False
+        self._faces_dirty = False
+        self._selection_dirty = False
+        self.flushes += 1
+        return True
+
+    def label(self) -> str:
+        return f"Mesh updates: {self.flushes} sent, {self.skipped} skipped"
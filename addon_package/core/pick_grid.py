@@ -0,0 +1,182 @@
+"""Screen-space segment grid used to pick edges under the cursor."""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..geom import point_segment_distance_sq, segment_intersections_2d
+from .cells import cell_coords, encode, gather_ranges, in_range, key_range
+
+
+# Segments needing more samples than this are checked by every query instead.
+MAX_SAMPLES_PER_SEGMENT = 512
+
+
+def _clip_to_rect(starts: np.ndarray, ends: np.ndarray, rect: Tuple[float, float, float, float]):
+    """Liang-Barsky clip of every segment to ``rect``; return clipped ends and a mask of survivors."""
+    delta = ends - starts
+    t0 = np.zeros(len(starts))
+    t1 = np.ones(len(starts))
+    keep = np.ones(len(starts), dtype=bool)
+    for axis, low, high in ((0, rect[0], rect[2]), (1, rect[1], rect[3])):
+        d = delta[:, axis]
+        for p, q in ((-d, starts[:, axis] - low), (d, high - starts[:, axis])):
+            parallel = p == 0.0
+            keep &= ~(parallel & (q < 0.0))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = q / p
+            entering = ~parallel & (p < 0.0)
+            leaving = ~parallel & (p > 0.0)
+            t0 = np.where(entering, np.maximum(t0, r), t0)
+            t1 = np.where(leaving, np.minimum(t1, r), t1)
+    keep &= t0 <= t1
+    return starts + t0[:, None] * delta, starts + t1[:, None] * delta, keep
+
+
+def nearest_segment(x: float, y: float, starts: np.ndarray, ends: np.ndarray, ids: np.ndarray,
+                    radius: float) -> Optional[Tuple[int, float]]:
+    """Return ``(id, distance_sq)`` of the closest segment strictly within ``radius``, in one reduction.
+
+    Ties are resolved towards the lowest id, which is what a linear scan in
+    id order keeping the first strictly closer edge would pick.
+    """
+    if not len(ids):
+        return None
+    dist_sq = point_segment_distance_sq(np.array((x, y), dtype=starts.dtype), starts, ends)
+    best_dist = dist_sq.min()
+    if not best_dist < radius * radius:
+        return None
+    ties = np.flatnonzero(dist_sq == best_dist)
+    best = ties[np.argmin(ids[ties])]
+    return int(ids[best]), float(best_dist)
+
+
+def crossing_segments(start, end, starts: np.ndarray, ends: np.ndarray,
+                      ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(ids, s, u)`` of the segments crossed by ``start``-``end``.
+
+    ``s`` is the crossing parameter along ``start``-``end`` and ``u`` along
+    each crossed segment, both in [0, 1]. Parallel segments never cross.
+    """
+    s, u, hit = segment_intersections_2d(start, end, starts, ends)
+    return ids[hit], s[hit], u[hit]
+
+
+class ScreenSegmentGrid:
+    """Buckets projected edges into square cells of ``cell_size`` pixels.
+
+    Each segment is sampled at half-cell steps along its part inside ``bounds``
+    and registered in the cells of its samples; the ``(key, id)`` pairs are
+    kept sorted by key as in ``ScreenGrid``. A query reads the cells within its
+    radius plus a quarter cell, which covers every segment point closer than
+    the radius, so picking cost depends on the edges near the cursor only.
+
+    An edit is patched in with ``renumber`` and ``extend`` instead of a
+    rebuild: dropped segments keep their cells but are skipped by queries.
+    """
+
+    def __init__(self, cell_size: float, starts: np.ndarray, ends: np.ndarray, ids: np.ndarray,
+                 bounds: Optional[Tuple[float, float, float, float]] = None):
+        self.cell_size = cell_size
+        self._bounds = bounds
+        self._starts = starts
+        self._ends = ends
+        self._ids = ids
+
+        keys, owners, self._large = self._sample(starts, ends, 0)
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._owners = owners[order]
+
+    def _sample(self, starts: np.ndarray, ends: np.ndarray, first: int):
+        """Return ``(keys, positions, large)`` of the segments, whose positions start at ``first``."""
+        positions = np.arange(first, first + len(starts))
+        clip_starts, clip_ends = starts, ends
+        if self._bounds is not None:
+            clip_starts, clip_ends, inside = _clip_to_rect(starts, ends, self._bounds)
+            positions = positions[inside]
+            clip_starts, clip_ends = clip_starts[inside], clip_ends[inside]
+
+        lengths = np.hypot(*(clip_ends - clip_starts).T)
+        counts = np.ceil(2.0 * lengths / self.cell_size).astype(np.int64) + 1
+        large = counts > MAX_SAMPLES_PER_SEGMENT
+
+        small = ~large
+        small_positions, counts = positions[small], counts[small]
+        clip_starts, clip_ends = clip_starts[small], clip_ends[small]
+        total = int(counts.sum())
+        owner = np.repeat(np.arange(len(small_positions)), counts)
+        step = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        factor = step / np.maximum(counts[owner] - 1, 1)
+        samples = clip_starts[owner] + factor[:, None] * (clip_ends[owner] - clip_starts[owner])
+        cells = cell_coords(samples, self.cell_size)
+        keys = encode(cells[:, 0], cells[:, 1])
+
+        # Consecutive samples of one segment often share a cell; drop the repeats.
+        fresh = np.ones(total, dtype=bool)
+        fresh[1:] = (keys[1:] != keys[:-1]) | (owner[1:] != owner[:-1])
+        return keys[fresh], small_positions[owner][fresh], positions[large]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._ids >= 0))
+
+    def renumber(self, mapping: np.ndarray):
+        """Replace every id by ``mapping[id]``; segments mapped to -1 are dropped."""
+        self._ids = np.where(self._ids >= 0, mapping[self._ids], -1)
+
+    def extend(self, starts: np.ndarray, ends: np.ndarray, ids: np.ndarray):
+        """Add segments, merging their cells into the sorted keys in one pass."""
+        first = len(self._ids)
+        self._starts = np.concatenate((self._starts, starts))
+        self._ends = np.concatenate((self._ends, ends))
+        self._ids = np.concatenate((self._ids, ids))
+
+        keys, owners, large = self._sample(starts, ends, first)
+        order = np.argsort(keys, kind="stable")
+        at = np.searchsorted(self._keys, keys[order], side="right")
+        self._keys = np.insert(self._keys, at, keys[order])
+        self._owners = np.insert(self._owners, at, owners[order])
+        self._large = np.concatenate((self._large, large))
+
+    def _live(self, positions: np.ndarray) -> np.ndarray:
+        return positions[self._ids[positions] >= 0]
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[Tuple[int, float]]:
+        """Same result as ``nearest_segment`` over all segments, reading only the cells near ``(x, y)``."""
+        span = math.ceil((radius + 0.25 * self.cell_size) / self.cell_size)
+        cx = math.floor(x / self.cell_size)
+        cy = math.floor(y / self.cell_size)
+        if not in_range(span, cx, cy):
+            return None
+
+        found: List[np.ndarray] = [self._large]
+        for ix in range(cx - span, cx + span + 1):
+            lo, hi = key_range(self._keys, encode(ix, cy - span), encode(ix, cy + span))
+            if lo < hi:
+                found.append(self._owners[lo:hi])
+        positions = self._live(np.unique(np.concatenate(found)))
+        return nearest_segment(x, y, self._starts[positions], self._ends[positions], self._ids[positions], radius)
+
+    def crossing(self, start, end) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same result as ``crossing_segments`` over all segments, reading only the cells along the line.
+
+        The line is sampled at half-cell steps like the segments, so a crossing
+        point lies within half a cell of a line sample and of a segment sample:
+        the 3x3 cells around each line sample hold every crossed segment.
+        """
+        start = np.asarray(start, dtype=np.float64)
+        end = np.asarray(end, dtype=np.float64)
+        count = int(math.ceil(2.0 * math.hypot(*(end - start)) / self.cell_size)) + 1
+        factor = np.arange(count) / max(count - 1, 1)
+        samples = start + factor[:, None] * (end - start)
+        cells = cell_coords(samples, self.cell_size, margin=1)
+        offsets = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)], dtype=np.int64)
+        neighbours = (cells[:, None, :] + offsets).reshape(-1, 2)
+        keys = np.unique(encode(neighbours[:, 0], neighbours[:, 1]))
+
+        index = gather_ranges(*key_range(self._keys, keys, keys))
+        positions = self._live(np.unique(np.concatenate((self._large, self._owners[index]))))
+        return crossing_segments(start, end, self._starts[positions], self._ends[positions], self._ids[positions])
@@ -0,0 +1,149 @@
+"""Cached BVH picking against the visible objects of a scene."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import bpy
+import numpy as np
+from mathutils import Matrix, Vector
+from mathutils.bvhtree import BVHTree
+
+
+# Object types with evaluated surface geometry, like the ones ``scene.ray_cast``
+# hits; ``BVHTree.FromObject`` converts all of them to a mesh.
+PICKABLE_TYPES = frozenset({"MESH", "CURVE", "SURFACE", "FONT", "META"})
+
+
+@dataclass
+class _PickEntry:
+    """BVH of one object, built in object space on first use."""
+
+    matrix_world: Matrix
+    matrix_world_inv: Matrix
+    bvh: Optional[BVHTree] = None
+
+
+def _ray_box_entry(origin: np.ndarray, direction: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """Return the ray parameter where the ray enters each box, ``inf`` for boxes it misses."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv = 1.0 / direction
+        t1 = (mins - origin) * inv
+        t2 = (maxs - origin) * inv
+    t_near = np.nanmax(np.minimum(t1, t2), axis=1)
+    t_far = np.nanmin(np.maximum(t1, t2), axis=1)
+    entry = np.maximum(t_near, 0.0)
+    return np.where(t_far >= entry, entry, np.inf)
+
+
+class PickingCache:
+    """Ray casts against per-object BVH trees instead of ``scene.ray_cast``.
+
+    World-space bounding boxes of all visible objects with surface geometry
+    (meshes, curves, surfaces, text and metaballs) are kept in one array, so a
+    ray is tested against every box in a single vectorised step and only the
+    objects it crosses are ray cast, nearest box first. BVH trees are built
+    lazily from the evaluated geometry and dropped when the depsgraph reports a
+    geometry or transform update for their object. Instanced geometry is not
+    covered.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _PickEntry] = {}
+        self._names: List[str] = []
+        self._mins = np.empty((0, 3))
+        self._maxs = np.empty((0, 3))
+        self._stale = True
+
+    # ----- invalidation ------------------------------------------------------
+    def attach(self):
+        if self.on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(self.on_depsgraph_update)
+
+    def detach(self):
+        if self.on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(self.on_depsgraph_update)
+
+    def invalidate(self, name: Optional[str] = None):
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+        self._stale = True
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                if update.is_updated_geometry or update.is_updated_transform:
+                    self.invalidate(update.id.original.name)
+            elif isinstance(update.id, (bpy.types.Collection, bpy.types.Scene)):
+                # Objects may have been linked, unlinked or hidden.
+                self._stale = True
+
+    # ----- queries -----------------------------------------------------------
+    def _refresh(self, context):
+        depsgraph = context.evaluated_depsgraph_get()
+        names = []
+        mins = []
+        maxs = []
+        for obj in context.visible_objects:
+            if obj.type not in PICKABLE_TYPES:
+                continue
+            obj_eval = obj.evaluated_get(depsgraph)
+            matrix_world = obj_eval.matrix_world.copy()
+            corners = np.array([matrix_world @ Vector(corner) for corner in obj_eval.bound_box])
+            names.append(obj.name)
+            mins.append(corners.min(axis=0))
+            maxs.append(corners.max(axis=0))
+            if obj.name not in self._entries:
+                self._entries[obj.name] = _PickEntry(matrix_world, matrix_world.inverted_safe())
+
+        self._names = names
+        self._mins = np.array(mins).reshape(-1, 3)
+        self._maxs = np.array(maxs).reshape(-1, 3)
+        self._stale = False
+
+    def ray_cast(self, context, origin: Vector, direction: Vector) -> Tuple[bool, Optional[Vector]]:
+        """Return ``(hit, location)`` of the nearest surface hit along the ray, in world space."""
+        if self._stale:
+            self._refresh(context)
+        if not self._names:
+            return False, None
+
+        entry_t = _ray_box_entry(np.array(origin), np.array(direction), self._mins, self._maxs)
+        candidates = np.flatnonzero(np.isfinite(entry_t))
+        candidates = candidates[np.argsort(entry_t[candidates])]
+
+        direction = direction.normalized()
+        best_dist = float("inf")
+        best_location = None
+        depsgraph = None
+        for idx in candidates:
+            if entry_t[idx] > best_dist:
+                break
+
+            name = self._names[idx]
+            entry = self._entries[name]
+            if entry.bvh is None:
+                if depsgraph is None:
+                    depsgraph = context.evaluated_depsgraph_get()
+                try:
+                    entry.bvh = BVHTree.FromObject(bpy.data.objects[name], depsgraph)
+                except ValueError:
+                    # No geometry to convert, e.g. a metaball that is not the basis of its family.
+                    entry.bvh = BVHTree.FromPolygons([], [])
+
+            local_origin = entry.matrix_world_inv @ origin
+            local_direction = entry.matrix_world_inv.to_3x3() @ direction
+            location, _, _, _ = entry.bvh.ray_cast(local_origin, local_direction)
+            if location is None:
+                continue
+
+            world_location = entry.matrix_world @ location
+            dist = (world_location - origin).length
+            if dist < best_dist:
+                best_dist = dist
+                best_location = world_location
+
+        return best_location is not None, best_location
@@ -0,0 +1,101 @@
+"""Opt-in per-stage latency recording for the modal operators."""
+
+from __future__ import annotations
+
+import csv
+import functools
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+
+# Upper edges of the histogram buckets, in milliseconds; the last bucket is open-ended.
+BUCKET_EDGES_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0)
+
+DEFAULT_CAPACITY = 4096
+
+# The last profiler of each tool, kept after its session ends for the sidebar panel.
+sessions: Dict[str, "StageProfiler"] = {}
+
+
+class StageTimes:
+    """Ring buffer of the most recent ``capacity`` durations of one stage, in seconds."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._samples = np.zeros(capacity)
+        self.count = 0
+
+    def add(self, seconds: float):
+        self._samples[self.count % len(self._samples)] = seconds
+        self.count += 1
+
+    def values_ms(self) -> np.ndarray:
+        return self._samples[:min(self.count, len(self._samples))] * 1000.0
+
+    def histogram(self) -> np.ndarray:
+        """Sample counts per bucket of ``BUCKET_EDGES_MS``, plus one for everything slower."""
+        buckets = np.searchsorted(BUCKET_EDGES_MS, self.values_ms(), side="right")
+        return np.bincount(buckets, minlength=len(BUCKET_EDGES_MS) + 1)
+
+    def summary(self) -> Tuple[float, float, float]:
+        """``(p50, p95, max)`` of the buffered samples in milliseconds."""
+        values = self.values_ms()
+        if not len(values):
+            return 0.0, 0.0, 0.0
+        p50, p95 = np.percentile(values, (50, 95))
+        return float(p50), float(p95), float(values.max())
+
+
+class StageProfiler:
+    """Times the stages of one tool session into ``StageTimes`` ring buffers.
+
+    Operators wrap their stage methods with ``wrap`` when profiling is turned
+    on and call them as usual; with profiling off nothing is wrapped, so the
+    stages run without any timing code.
+    """
+
+    def __init__(self, tool: str, capacity: int = DEFAULT_CAPACITY):
+        self.tool = tool
+        self.capacity = capacity
+        self.stages: Dict[str, StageTimes] = {}
+        sessions[tool] = self
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        times = self.stages.setdefault(stage, StageTimes(self.capacity))
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                times.add(time.perf_counter() - start)
+
+        return timed
+
+    def rows(self) -> List[Tuple[str, int, float, float, float]]:
+        """``(stage, calls, p50, p95, max)`` for every stage called at least once, times in milliseconds."""
+        return [(stage, times.count, *times.summary()) for stage, times in self.stages.items() if times.count]
+
+    def csv_rows(self) -> List[list]:
+        """One row per called stage: tool, stage, calls, percentiles and histogram bucket counts."""
+        rows = []
+        for stage, times in self.stages.items():
+            if times.count:
+                p50, p95, worst = times.summary()
+                rows.append([
+                    self.tool, stage, times.count, f"{p50:.4f}", f"{p95:.4f}", f"{worst:.4f}",
+                    *times.histogram().tolist(),
+                ])
+        return rows
+
+
+def write_csv(path: str, profilers):
+    """Write the stage rows of ``profilers`` to ``path`` with a header naming the buckets."""
+    bucket_names = [f"<{edge:g}ms" for edge in BUCKET_EDGES_MS] + [f">={BUCKET_EDGES_MS[-1]:g}ms"]
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["tool", "stage", "calls", "p50_ms", "p95_ms", "max_ms", *bucket_names])
+        for profiler in profilers:
+            writer.writerows(profiler.csv_rows())
@@ -0,0 +1,39 @@
+"""Redraw gating for modal operators."""
+
+from __future__ import annotations
+
+
+def freeze(value):
+    """``value`` as a hashable, comparable snapshot: scalars as they are, sequences as tuples."""
+    if value is None or isinstance(value, (int, float, str, tuple)):
+        return value
+    return tuple(value)
+
+
+class RedrawTracker:
+    """Requests a viewport redraw only when the visible operator state changed.
+
+    Callers pass everything their overlay or the viewport shows for the tool
+    (preview endpoints, snap target, constraint, ...). Vectors and other
+    sequences are compared by value.
+    """
+
+    _UNSET = object()
+
+    def __init__(self):
+        self._state = self._UNSET
+        self.requested = 0
+        self.skipped = 0
+
+    def update(self, area, *state) -> bool:
+        key = tuple(freeze(value) for value in state)
+        if key == self._state:
+            self.skipped += 1
+            return False
+        self._state = key
+        self.requested += 1
+        area.tag_redraw()
+        return True
+
+    def label(self) -> str:
+        return f"Redraws: {self.requested} requested, {self.skipped} skipped"
@@ -0,0 +1,314 @@
+"""World-space segment grid used to find edge crossings while drawing."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..geom import segment_crossings, transform_points
+from .cells import cell_coords, cell_frame, encode, gather_ranges, key_range
+from .mesh_arrays import read_edge_arrays, read_vertex_arrays
+
+
+# Segments whose bounding box covers more cells than this are checked by every query instead.
+MAX_CELLS_PER_SEGMENT = 64
+
+# Tail entries are merged into the sorted cell arrays once there are this many.
+_TAIL_LIMIT = 4096
+
+# Crossings closer than this to a segment end, in world units, count as touching the end.
+DEFAULT_TOLERANCE = 1e-4
+
+Coord = Tuple[float, float, float]
+
+
+class SegmentGrid:
+    """Uniform 3D grid over world-space segments, keyed by row (edge index).
+
+    Each segment is registered in every cell its bounding box covers, stored
+    as ``(key, row)`` pairs sorted by key like ``ScreenGrid``. Segments covering
+    more than ``MAX_CELLS_PER_SEGMENT`` cells go to a list every query checks.
+    Endpoints are kept in growable arrays and read at query time, so a segment
+    that was shortened by a split may keep stale cells, which only costs an
+    extra candidate. Cells are counted from the centre of the initial segments
+    (see ``cell_frame``); later segments far outside them clamp to the border
+    cells, which again only costs candidates.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, cell_size: Optional[float] = None):
+        self._size = len(starts)
+        capacity = max(256, self._size)
+        self._starts = np.empty((capacity, 3), dtype=np.float64)
+        self._ends = np.empty((capacity, 3), dtype=np.float64)
+        self._starts[:self._size] = starts
+        self._ends[:self._size] = ends
+
+        if cell_size is None:
+            lengths = np.linalg.norm(self._ends[:self._size] - self._starts[:self._size], axis=1)
+            lengths = lengths[lengths > 0.0]
+            cell_size = float(np.median(lengths)) if len(lengths) else 1.0
+        self._origin, self.cell_size = cell_frame(
+            np.concatenate((self._starts[:self._size], self._ends[:self._size])), cell_size)
+
+        keys, rows, large = self._cells_of(np.arange(self._size))
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._rows = rows[order]
+        self._large: List[int] = large.tolist()
+        self._tail_keys: List[int] = []
+        self._tail_rows: List[int] = []
+
+    @classmethod
+    def from_object(cls, obj) -> "SegmentGrid":
+        """Build the grid over all visible edges of the edit-mode mesh of ``obj``."""
+        obj.update_from_editmode()
+        vert_co, _ = read_vertex_arrays(obj.data)
+        edge_verts, edge_hide = read_edge_arrays(obj.data)
+        world_co = transform_points(vert_co, obj.matrix_world)
+        starts = world_co[edge_verts[:, 0]]
+        ends = world_co[edge_verts[:, 1]]
+        # Hidden edges keep their row but collapse to a point, which never crosses anything.
+        ends[edge_hide] = starts[edge_hide]
+        return cls(starts, ends)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def endpoints(self, rows) -> Tuple[np.ndarray, np.ndarray]:
+        return self._starts[rows], self._ends[rows]
+
+    def _cells_of(self, rows: np.ndarray):
+        """Return ``(keys, rows)`` of every cell covered by ``rows`` plus the rows that are too large."""
+        starts = self._starts[rows]
+        ends = self._ends[rows]
+        lo = cell_coords(np.minimum(starts, ends), self.cell_size, origin=self._origin)
+        hi = cell_coords(np.maximum(starts, ends), self.cell_size, origin=self._origin)
+        extent = hi - lo + 1
+        counts = extent.prod(axis=1)
+        large = counts > MAX_CELLS_PER_SEGMENT
+
+        small = ~large
+        lo, extent, counts, small_rows = lo[small], extent[small], counts[small], rows[small]
+        total = int(counts.sum())
+        owner = np.repeat(np.arange(len(small_rows)), counts)
+        local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        nx = extent[owner, 0]
+        ny = extent[owner, 1]
+        cx = lo[owner, 0] + local % nx
+        cy = lo[owner, 1] + (local // nx) % ny
+        cz = lo[owner, 2] + local // (nx * ny)
+        return encode(cx, cy, cz), small_rows[owner], rows[large]
+
+    def _grow(self):
+        capacity = len(self._starts) * 2
+        for name in ("_starts", "_ends"):
+            grown = np.empty((capacity, 3), dtype=np.float64)
+            grown[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, grown)
+
+    def _register(self, row: int):
+        keys, rows, large = self._cells_of(np.array([row]))
+        self._large.extend(large.tolist())
+        self._tail_keys.extend(keys.tolist())
+        self._tail_rows.extend(rows.tolist())
+        if len(self._tail_keys) >= _TAIL_LIMIT:
+            keys = np.concatenate((self._keys, np.array(self._tail_keys, dtype=np.int64)))
+            rows = np.concatenate((self._rows, np.array(self._tail_rows, dtype=np.int64)))
+            order = np.argsort(keys, kind="stable")
+            self._keys = keys[order]
+            self._rows = rows[order]
+            self._tail_keys = []
+            self._tail_rows = []
+
+    def append(self, start, end) -> int:
+        if self._size == len(self._starts):
+            self._grow()
+        row = self._size
+        self._starts[row] = start
+        self._ends[row] = end
+        self._size += 1
+        self._register(row)
+        return row
+
+    def set(self, row: int, start, end):
+        """Move the endpoints of ``row``; cells of the old position are kept."""
+        self._starts[row] = start
+        self._ends[row] = end
+        self._register(row)
+
+    def candidates(self, start, end) -> np.ndarray:
+        """Rows of all segments with a cell next to the segment ``start``-``end``."""
+        start = np.asarray(start, dtype=np.float64)
+        end = np.asarray(end, dtype=np.float64)
+        # Samples at most half a cell apart; with their 27 neighbouring cells they
+        # cover everything within half a cell of the segment.
+        steps = max(1, int(np.ceil(2.0 * np.linalg.norm(end - start) / self.cell_size)))
+        samples = start + np.linspace(0.0, 1.0, steps + 1)[:, None] * (end - start)
+        cells = cell_coords(samples, self.cell_size, margin=1, origin=self._origin)
+        offsets = np.stack(np.meshgrid((-1, 0, 1), (-1, 0, 1), (-1, 0, 1), indexing="ij"), axis=-1).reshape(-1, 3)
+        cells = (cells[:, None, :] + offsets[None, :, :]).reshape(-1, 3)
+        query = np.unique(encode(cells[:, 0], cells[:, 1], cells[:, 2]))
+
+        found = [self._rows[gather_ranges(*key_range(self._keys, query, query))]]
+        if self._tail_keys:
+            tail_keys = np.array(self._tail_keys, dtype=np.int64)
+            found.append(np.array(self._tail_rows, dtype=np.int64)[np.isin(tail_keys, query)])
+        if self._large:
+            found.append(np.array(self._large, dtype=np.int64))
+        return np.unique(np.concatenate(found))
+
+
+@dataclass
+class SplitPlan:
+    """Where new segments cross existing edges and each other.
+
+    ``points`` are the split positions in world space, each with the buffered
+    vertex row it coincides with, or ``None`` for a new crossing vertex.
+    ``edge_cuts`` maps an existing edge row to ``(u, point)`` pairs and
+    ``segment_cuts`` lists ``(t, point)`` pairs per new segment, both sorted by
+    the parameter along the edge or segment.
+    """
+
+    points: List[Tuple[Coord, Optional[int]]] = field(default_factory=list)
+    edge_cuts: Dict[int, List[Tuple[float, int]]] = field(default_factory=dict)
+    segment_cuts: List[List[Tuple[float, int]]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.points)
+
+
+def plan_splits(
+    grid: SegmentGrid,
+    segments: np.ndarray,
+    ends_new: np.ndarray,
+    end_rows: np.ndarray,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> SplitPlan:
+    """Find the crossings of new ``segments`` ``(k, 2, 3)`` with the grid and with each other.
+
+    A new segment that crosses an existing edge splits both at a shared vertex.
+    A new segment end that lies on the inside of an existing edge (a T junction)
+    splits that edge at the end vertex, if ``ends_new`` marks the end as a
+    vertex that is not in the mesh yet; ``end_rows`` gives the row of each end.
+    Crossings between two new segments split both of them.
+    """
+    plan = SplitPlan(segment_cuts=[[] for _ in range(len(segments))])
+    row_points: Dict[int, int] = {}
+
+    def add_point(co, row=None) -> int:
+        if row is not None and row in row_points:
+            return row_points[row]
+        plan.points.append(((float(co[0]), float(co[1]), float(co[2])), row))
+        if row is not None:
+            row_points[row] = len(plan.points) - 1
+        return len(plan.points) - 1
+
+    for index, (start, end) in enumerate(segments):
+        length = np.linalg.norm(end - start)
+        if length <= tolerance:
+            continue
+        rows = grid.candidates(start, end)
+        if len(rows):
+            starts, ends = grid.endpoints(rows)
+            t, u, dist = segment_crossings(start, end, starts, ends)
+            edge_length = np.linalg.norm(ends - starts, axis=1)
+            with np.errstate(invalid="ignore"):
+                near = dist <= tolerance
+                inside_u = (u * edge_length > tolerance) & ((1.0 - u) * edge_length > tolerance)
+                inside_t = (t * length > tolerance) & ((1.0 - t) * length > tolerance)
+                at_start = np.abs(t) * length <= tolerance
+                at_end = np.abs(1.0 - t) * length <= tolerance
+            hit = near & inside_u
+            for i in np.flatnonzero(hit & inside_t):
+                point = add_point(start + t[i] * (end - start))
+                plan.edge_cuts.setdefault(int(rows[i]), []).append((float(u[i]), point))
+                plan.segment_cuts[index].append((float(t[i]), point))
+            for end_index, touching in ((0, at_start), (1, at_end)):
+                if not ends_new[index, end_index]:
+                    continue
+                for i in np.flatnonzero(hit & touching):
+                    point = add_point(segments[index, end_index], int(end_rows[index, end_index]))
+                    cuts = plan.edge_cuts.setdefault(int(rows[i]), [])
+                    if all(existing != point for _, existing in cuts):
+                        cuts.append((float(u[i]), point))
+
+        if index:
+            t, u, dist = segment_crossings(start, end, segments[:index, 0], segments[:index, 1])
+            other_length = np.linalg.norm(segments[:index, 1] - segments[:index, 0], axis=1)
+            with np.errstate(invalid="ignore"):
+                hit = (
+                    (dist <= tolerance)
+                    & (t * length > tolerance) & ((1.0 - t) * length > tolerance)
+                    & (u * other_length > tolerance) & ((1.0 - u) * other_length > tolerance)
+                )
+            for other in np.flatnonzero(hit):
+                point = add_point(start + t[other] * (end - start))
+                plan.segment_cuts[index].append((float(t[other]), point))
+                plan.segment_cuts[other].append((float(u[other]), point))
+
+    merged: Dict[int, int] = {}
+
+    def merge(point: int, into: int) -> bool:
+        # Two buffered vertices are never merged; otherwise a buffered vertex is kept.
+        point, into = _merged_target(merged, point), _merged_target(merged, into)
+        if point == into:
+            return True
+        if plan.points[point][1] is not None:
+            if plan.points[into][1] is not None:
+                return False
+            point, into = into, point
+        merged[point] = into
+        return True
+
+    for row, cuts in plan.edge_cuts.items():
+        # Cuts that coincide on an edge would make a zero-length piece; merge them into one point.
+        starts, ends = grid.endpoints(row)
+        length = float(np.linalg.norm(ends - starts))
+        plan.edge_cuts[row] = _merge_close_cuts(cuts, tolerance / max(length, tolerance), merge)
+    for index, cuts in enumerate(plan.segment_cuts):
+        # The same along a new segment, e.g. where two segments and an edge meet.
+        length = float(np.linalg.norm(segments[index, 1] - segments[index, 0]))
+        plan.segment_cuts[index] = _merge_close_cuts(cuts, tolerance / max(length, tolerance), merge)
+    _compact_points(plan, merged)
+    return plan
+
+
+def _merge_close_cuts(cuts: List[Tuple[float, int]], step: float, merge) -> List[Tuple[float, int]]:
+    """Sort ``cuts`` and merge the points of cuts at most ``step`` apart.
+
+    Where two buffered vertices coincide they cannot be merged, and the later
+    cut is dropped: the edge or segment is split at the first one only.
+    """
+    cuts.sort()
+    kept = cuts[:1]
+    for param, point in cuts[1:]:
+        if param - kept[-1][0] > step:
+            kept.append((param, point))
+        else:
+            merge(point, kept[-1][1])
+    return kept
+
+
+def _merged_target(merged: Dict[int, int], point: int) -> int:
+    while point in merged:
+        point = merged[point]
+    return point
+
+
+def _compact_points(plan: SplitPlan, merged: Dict[int, int]):
+    """Send the cuts of ``merged`` points to the points they merged into and drop the points no cut uses."""
+    cut_lists = [*plan.edge_cuts.values(), *plan.segment_cuts]
+    for cuts in cut_lists:
+        # An edge or segment through several merged points keeps the first cut there.
+        kept: Dict[int, float] = {}
+        for param, point in cuts:
+            kept.setdefault(_merged_target(merged, point), param)
+        cuts[:] = [(param, point) for point, param in kept.items()]
+
+    used = sorted({point for cuts in cut_lists for _, point in cuts})
+    renumbered = {point: index for index, point in enumerate(used)}
+    plan.points = [plan.points[point] for point in used]
+    for cuts in cut_lists:
+        cuts[:] = [(param, renumbered[point]) for param, point in cuts]
@@ -0,0 +1,188 @@
+"""Screen-space bucket grid used to accelerate snap queries."""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ..geom import project_to_region
+from .cells import cell_coords, encode, in_range, key_range
+from .frustum import box_corners, boxes_in_frustum
+
+
+class ScreenGrid:
+    """Buckets projected snap candidates into square cells of ``cell_size`` pixels.
+
+    Candidates are stored sorted by cell key, column-major, so the cells of one
+    grid column covered by a query form a single contiguous slice. A query only
+    visits the cells overlapping the search radius, so its cost does not depend
+    on how many candidates the mesh has.
+
+    Batches added with ``extend`` are kept as separate sorted segments until
+    ``compact`` merges them, and single candidates added with ``add`` go to a
+    short unsorted tail that every query scans.
+    """
+
+    def __init__(self, cell_size: float, points: Optional[np.ndarray] = None, ids: Optional[np.ndarray] = None):
+        self.cell_size = cell_size
+        self._segments: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._tail_points: List[Tuple[float, float]] = []
+        self._tail_ids: List[int] = []
+        if points is not None:
+            self.extend(points, ids)
+
+    def __len__(self) -> int:
+        return sum(len(ids) for _, _, ids in self._segments) + len(self._tail_ids)
+
+    def extend(self, points: np.ndarray, ids: np.ndarray):
+        if not len(ids):
+            return
+        cells = cell_coords(points, self.cell_size)
+        keys = encode(cells[:, 0], cells[:, 1])
+        order = np.argsort(keys, kind="stable")
+        self._segments.append((keys[order], points[order], ids[order]))
+
+    def compact(self):
+        """Merge all sorted segments into one."""
+        if len(self._segments) < 2:
+            return
+        keys, points, ids = (np.concatenate(parts) for parts in zip(*self._segments))
+        order = np.argsort(keys, kind="stable")
+        self._segments = [(keys[order], points[order], ids[order])]
+
+    def add(self, candidate_id: int, x: float, y: float):
+        self._tail_points.append((x, y))
+        self._tail_ids.append(candidate_id)
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def nearest(self, x: float, y: float, radius: float) -> Optional[Tuple[int, float, float]]:
+        """Return ``(id, screen_x, screen_y)`` of the closest candidate strictly within ``radius``.
+
+        Ties are resolved towards the lowest id, which is what a linear scan in
+        id order would pick.
+        """
+        span = max(1, math.ceil(radius / self.cell_size))
+        cx, cy = self._cell_of(x, y)
+        if not in_range(span, cx, cy):
+            return None
+
+        points = []
+        ids = []
+        for keys, seg_points, seg_ids in self._segments:
+            for ix in range(cx - span, cx + span + 1):
+                lo, hi = key_range(keys, encode(ix, cy - span), encode(ix, cy + span))
+                if lo < hi:
+                    points.append(seg_points[lo:hi])
+                    ids.append(seg_ids[lo:hi])
+        if self._tail_ids:
+            points.append(np.array(self._tail_points, dtype=np.float32))
+            ids.append(np.array(self._tail_ids, dtype=np.int64))
+        if not ids:
+            return None
+
+        points = np.concatenate(points)
+        ids = np.concatenate(ids)
+        delta = points - np.array((x, y), dtype=np.float32)
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        inside = dist < radius
+        if not inside.any():
+            return None
+
+        dist = dist[inside]
+        ids = ids[inside]
+        points = points[inside]
+        ties = np.flatnonzero(dist == dist.min())
+        best = ties[np.argmin(ids[ties])]
+        screen_x, screen_y = points[best]
+        return int(ids[best]), float(screen_x), float(screen_y)
+
+
+def _rect_distance(rects: np.ndarray, x: float, y: float) -> np.ndarray:
+    dx = np.maximum(np.maximum(rects[:, 0] - x, x - rects[:, 2]), 0.0)
+    dy = np.maximum(np.maximum(rects[:, 1] - y, y - rects[:, 3]), 0.0)
+    return np.hypot(dx, dy)
+
+
+class GridBuildJob:
+    """Fills a ``ScreenGrid`` from snap targets, chunks nearest to the cursor first.
+
+    Chunks that pass the frustum test are ordered by the distance from the
+    cursor to their projected screen rectangle, i.e. in rings around the cursor.
+    ``step`` projects chunks until a deadline, so a large target set can be
+    indexed over several ticks while queries use the part built so far.
+    """
+
+    def __init__(self, targets, matrix, width: int, height: int, cursor: Tuple[float, float], radius: float):
+        self.grid = ScreenGrid(radius)
+        self.projected = 0
+        self._targets = targets
+        self._matrix = matrix
+        self._width = width
+        self._height = height
+        self._radius = radius
+
+        margin_x = 2.0 * radius / max(width, 1)
+        margin_y = 2.0 * radius / max(height, 1)
+        mins, maxs = targets.chunk_bounds()
+        chunks = np.empty(0, dtype=np.int64)
+        # Cull the whole target set first, then per chunk.
+        if len(mins) and boxes_in_frustum(
+            mins.min(axis=0, keepdims=True), maxs.max(axis=0, keepdims=True), matrix, margin_x, margin_y
+        )[0]:
+            chunks = np.flatnonzero(boxes_in_frustum(mins, maxs, matrix, margin_x, margin_y))
+
+        rects = self._screen_rects(mins[chunks], maxs[chunks])
+        order = np.argsort(_rect_distance(rects, *cursor), kind="stable")
+        self._chunks = chunks[order]
+        self._rects = rects[order]
+        self._next = 0
+
+    def _screen_rects(self, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """Return the ``(x0, y0, x1, y1)`` screen rectangle covered by each box."""
+        corners = box_corners(mins, maxs).reshape(-1, 3)
+        xy, valid = project_to_region(corners, self._matrix, self._width, self._height)
+        xy = xy.reshape(-1, 8, 2)
+        rects = np.concatenate((xy.min(axis=1), xy.max(axis=1)), axis=1)
+        # A box reaching behind the view has no bounded projection.
+        rects[~valid.reshape(-1, 8).all(axis=1)] = (-np.inf, -np.inf, np.inf, np.inf)
+        return rects
+
+    @property
+    def done(self) -> bool:
+        return self._next >= len(self._chunks)
+
+    def step(self, deadline: float = math.inf):
+        """Project chunks into the grid until ``deadline`` (``time.perf_counter``) has passed."""
+        radius = self._radius
+        pieces_xy = []
+        pieces_rows = []
+        while not self.done:
+            rows = self._targets.rows_of_chunk(int(self._chunks[self._next]))
+            self._next += 1
+            rows = rows[self._targets.visible[rows]]
+            xy, valid = project_to_region(self._targets.coords[rows], self._matrix, self._width, self._height)
+            valid &= (
+                (xy[:, 0] >= -radius) & (xy[:, 0] <= self._width + radius)
+                & (xy[:, 1] >= -radius) & (xy[:, 1] <= self._height + radius)
+            )
+            self.projected += len(rows)
+            pieces_xy.append(xy[valid])
+            pieces_rows.append(rows[valid])
+            if time.perf_counter() >= deadline:
+                break
+
+        if pieces_rows:
+            self.grid.extend(np.concatenate(pieces_xy), np.concatenate(pieces_rows))
+        if self.done:
+            self.grid.compact()
+
+    def is_final_for(self, x: float, y: float) -> bool:
+        """True when no chunk left to project can hold a candidate within the radius of ``(x, y)``."""
+        if self.done:
+            return True
+        return bool((_rect_distance(self._rects[self._next:], x, y) >= self._radius).all())
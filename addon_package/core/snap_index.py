@@ -0,0 +1,150 @@
+"""Persistent world-space store of snap targets for the line tool."""
+
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+
+from .mesh_arrays import read_edge_arrays, read_vertex_arrays
+
+
+CHUNK_SIZE = 1024
+
+
+class SnapTargets:
+    """World-space snap targets of one element type, keyed by element index.
+
+    Row ``i`` holds the target of vertex or edge ``i`` (hidden elements keep
+    their row and are masked out by ``visible``), so the operator can patch the
+    row of an element it creates instead of recomputing the set. Storage grows
+    by doubling, which keeps appends amortised O(1) and the rows contiguous.
+
+    Rows are also grouped into chunks of ``CHUNK_SIZE`` with a bounding box per
+    chunk, so whole chunks can be culled before any of their rows is projected.
+    """
+
+    def __init__(self, coords: np.ndarray, visible: np.ndarray):
+        self._size = len(coords)
+        capacity = max(CHUNK_SIZE, self._size)
+        self._coords = np.empty((capacity, 3), dtype=np.float32)
+        self._coords[:self._size] = coords
+        self._visible = np.zeros(capacity, dtype=bool)
+        self._visible[:self._size] = visible
+
+        chunk_capacity = math.ceil(capacity / CHUNK_SIZE)
+        self._chunk_mins = np.full((chunk_capacity, 3), np.inf, dtype=np.float32)
+        self._chunk_maxs = np.full((chunk_capacity, 3), -np.inf, dtype=np.float32)
+        if self._size:
+            starts = np.arange(0, self._size, CHUNK_SIZE)
+            self._chunk_mins[:len(starts)] = np.minimum.reduceat(self.coords, starts, axis=0)
+            self._chunk_maxs[:len(starts)] = np.maximum.reduceat(self.coords, starts, axis=0)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def coords(self) -> np.ndarray:
+        return self._coords[:self._size]
+
+    @property
+    def visible(self) -> np.ndarray:
+        return self._visible[:self._size]
+
+    @property
+    def chunk_count(self) -> int:
+        return math.ceil(self._size / CHUNK_SIZE)
+
+    def chunk_bounds(self):
+        """Return ``(mins, maxs)`` of every chunk, shape ``(chunk_count, 3)`` each."""
+        count = self.chunk_count
+        return self._chunk_mins[:count], self._chunk_maxs[:count]
+
+    def rows_of_chunk(self, chunk: int) -> np.ndarray:
+        start = chunk * CHUNK_SIZE
+        return np.arange(start, min(start + CHUNK_SIZE, self._size))
+
+    def _grow(self):
+        capacity = len(self._coords) * 2
+        coords = np.empty((capacity, 3), dtype=np.float32)
+        coords[:self._size] = self.coords
+        visible = np.zeros(capacity, dtype=bool)
+        visible[:self._size] = self.visible
+        self._coords = coords
+        self._visible = visible
+
+        chunk_capacity = math.ceil(capacity / CHUNK_SIZE)
+        chunk_mins = np.full((chunk_capacity, 3), np.inf, dtype=np.float32)
+        chunk_maxs = np.full((chunk_capacity, 3), -np.inf, dtype=np.float32)
+        chunk_mins[:len(self._chunk_mins)] = self._chunk_mins
+        chunk_maxs[:len(self._chunk_maxs)] = self._chunk_maxs
+        self._chunk_mins = chunk_mins
+        self._chunk_maxs = chunk_maxs
+
+    def append(self, co) -> int:
+        if self._size == len(self._coords):
+            self._grow()
+        row = self._size
+        self._coords[row] = co[:3]
+        self._visible[row] = True
+        chunk = row // CHUNK_SIZE
+        np.minimum(self._chunk_mins[chunk], self._coords[row], out=self._chunk_mins[chunk])
+        np.maximum(self._chunk_maxs[chunk], self._coords[row], out=self._chunk_maxs[chunk])
+        self._size += 1
+        return row
+
+    def set(self, row: int, co):
+        """Move the target of an existing row; chunk bounds only ever grow."""
+        self._coords[row] = co[:3]
+        chunk = row // CHUNK_SIZE
+        np.minimum(self._chunk_mins[chunk], self._coords[row], out=self._chunk_mins[chunk])
+        np.maximum(self._chunk_maxs[chunk], self._coords[row], out=self._chunk_maxs[chunk])
+
+    def truncate(self, size: int):
+        """Drop all rows from ``size`` on, keeping the (now conservative) chunk bounds."""
+        self._size = min(self._size, size)
+
+    def co(self, row: int) -> np.ndarray:
+        return self._coords[row]
+
+
+class SnapIndex:
+    """Vertices and edge midpoints of one mesh, kept in world space between events.
+
+    The index is built once from a bulk read of the mesh and then patched by the
+    operator for every element it creates. Edge midpoints are computed once here
+    rather than on every snap query. Both tables are keyed by element index, so
+    a mismatch with the mesh element counts means the topology was changed
+    outside the operator and the index has to be rebuilt.
+    """
+
+    def __init__(self, vertices: SnapTargets, midpoints: SnapTargets):
+        self.vertices = vertices
+        self.midpoints = midpoints
+        self.build_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self.vertices) + len(self.midpoints)
+
+    @classmethod
+    def from_object(cls, obj) -> "SnapIndex":
+        """Build the index from the edit-mode mesh of ``obj``."""
+        start = time.perf_counter()
+        obj.update_from_editmode()
+        mesh = obj.data
+
+        vert_co, vert_hide = read_vertex_arrays(mesh)
+        edge_verts, edge_hide = read_edge_arrays(mesh)
+
+        matrix = np.asarray(obj.matrix_world, dtype=np.float32)
+        world_co = vert_co @ matrix[:3, :3].T + matrix[:3, 3]
+
+        midpoint_co = (world_co[edge_verts[:, 0]] + world_co[edge_verts[:, 1]]) / 2.0
+
+        index = cls(SnapTargets(world_co, ~vert_hide), SnapTargets(midpoint_co, ~edge_hide))
+        index.build_time = time.perf_counter() - start
+        return index
+
+    def matches(self, vert_count: int, edge_count: int) -> bool:
+        return vert_count == len(self.vertices) and edge_count == len(self.midpoints)
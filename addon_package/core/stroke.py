@@ -0,0 +1,59 @@
+"""Python-side buffer for line tool segments that are not in the mesh yet."""
+
+from __future__ import annotations
+
+from typing import List, Set, Tuple
+
+Coord = Tuple[float, float, float]
+
+
+class StrokeBuffer:
+    """Vertices and edges drawn by the user but not yet written to the mesh.
+
+    Vertices are referred to by row: rows below ``base`` are existing mesh
+    vertices (reused when the user snaps or welds to them), rows from ``base``
+    on are the buffered ``points_local`` in order. Those are provisional; BMesh
+    may put the committed vertices into slots freed by earlier deletions, so
+    the operator maps them to the real indices after the commit. Edges are
+    kept as row pairs for the mesh and as world-space segments for drawing.
+    """
+
+    def __init__(self, base: int = 0):
+        self.reset(base)
+
+    @property
+    def vert_count(self) -> int:
+        return len(self.points_local)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges)
+
+    def is_new(self, row: int) -> bool:
+        return row >= self.base
+
+    def add_vertex(self, co_local) -> int:
+        """Buffer a new vertex and return its row."""
+        self.points_local.append(co_local.copy())
+        return self.base + len(self.points_local) - 1
+
+    def has_edge(self, row_a: int, row_b: int) -> bool:
+        return (min(row_a, row_b), max(row_a, row_b)) in self._edge_keys
+
+    def add_edge(self, row_a: int, row_b: int, co_a_world, co_b_world):
+        self.edges.append((row_a, row_b))
+        self._edge_keys.add((min(row_a, row_b), max(row_a, row_b)))
+        self.segments_world.append(((co_a_world[0], co_a_world[1], co_a_world[2]),
+                                    (co_b_world[0], co_b_world[1], co_b_world[2])))
+
+    def preview_segments(self) -> Tuple[Tuple[Coord, Coord], ...]:
+        """World-space ``(start, end)`` pairs of the buffered edges."""
+        return tuple(self.segments_world)
+
+    def reset(self, base: int):
+        """Forget the buffered elements; new rows start at ``base``."""
+        self.base = base
+        self.points_local: List = []
+        self.edges: List[Tuple[int, int]] = []
+        self.segments_world: List[Tuple[Coord, Coord]] = []
+        self._edge_keys: Set[Tuple[int, int]] = set()
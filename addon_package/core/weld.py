@@ -0,0 +1,144 @@
+"""Distance-based vertex welding on world-space coordinate arrays."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .cells import cell_coords, cell_frame, encode, gather_ranges, key_range
+
+
+class WeldGrid:
+    """Finds the vertex within ``distance`` of a point, in world space.
+
+    Vertices are bucketed into cubic cells of at least ``distance``, counted
+    from the centre of the vertices (see ``cell_frame``), and stored sorted by
+    cell key, z fastest, so a query reads one contiguous slice per neighbouring
+    (x, y) column. Vertices added with ``add`` go to a short unsorted tail, as in
+    ``ScreenGrid``.
+    """
+
+    def __init__(self, distance: float, coords: np.ndarray, rows: np.ndarray):
+        self.distance = distance
+        self._origin, self._cell_size = cell_frame(coords, distance)
+        cells = cell_coords(coords, self._cell_size, margin=1, origin=self._origin)
+        keys = encode(cells[:, 0], cells[:, 1], cells[:, 2])
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._coords = np.asarray(coords, dtype=np.float64)[order]
+        self._rows = np.asarray(rows, dtype=np.int64)[order]
+        self._tail_coords: List[Tuple[float, float, float]] = []
+        self._tail_rows: List[int] = []
+
+    @classmethod
+    def from_targets(cls, distance: float, targets) -> "WeldGrid":
+        """Build the grid from the visible rows of a ``SnapTargets`` table."""
+        rows = np.flatnonzero(targets.visible)
+        return cls(distance, targets.coords[rows], rows)
+
+    def __len__(self) -> int:
+        return len(self._rows) + len(self._tail_rows)
+
+    def add(self, row: int, co: Sequence[float]):
+        self._tail_coords.append((co[0], co[1], co[2]))
+        self._tail_rows.append(row)
+
+    def find(self, co: Sequence[float]) -> Optional[int]:
+        """Return the row of the closest vertex within ``distance`` of ``co``, lowest row on ties."""
+        cell = cell_coords(np.array([co[:3]]), self._cell_size, margin=1, origin=self._origin)[0]
+        cx, cy, cz = (int(c) for c in cell)
+
+        coords = []
+        rows = []
+        for ix in range(cx - 1, cx + 2):
+            for iy in range(cy - 1, cy + 2):
+                lo, hi = key_range(self._keys, encode(ix, iy, cz - 1), encode(ix, iy, cz + 1))
+                if lo < hi:
+                    coords.append(self._coords[lo:hi])
+                    rows.append(self._rows[lo:hi])
+        if self._tail_rows:
+            coords.append(np.array(self._tail_coords, dtype=np.float64))
+            rows.append(np.array(self._tail_rows, dtype=np.int64))
+        if not rows:
+            return None
+
+        coords = np.concatenate(coords)
+        rows = np.concatenate(rows)
+        dist = np.linalg.norm(coords - np.array(co[:3], dtype=np.float64), axis=1)
+        inside = dist <= self.distance
+        if not inside.any():
+            return None
+
+        dist = dist[inside]
+        rows = rows[inside]
+        return int(rows[dist == dist.min()].min())
+
+
+def weld_map(coords: np.ndarray, distance: float, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return, for every vertex, the index of the vertex it should be merged into.
+
+    Vertices closer than ``distance`` are grouped transitively and every group
+    is merged into its lowest index; unmasked and ungrouped vertices map to
+    themselves. Sorting by cell key and one ``searchsorted`` per neighbouring
+    column make this O(n log n) for any mesh without dense clusters.
+    """
+    count = len(coords)
+    target = np.arange(count)
+    rows = np.arange(count) if mask is None else np.flatnonzero(mask)
+    if distance <= 0.0 or len(rows) < 2:
+        return target
+
+    points = np.asarray(coords, dtype=np.float64)[rows]
+    origin, cell_size = cell_frame(points, distance)
+    cells = cell_coords(points, cell_size, margin=1, origin=origin)
+    keys = encode(cells[:, 0], cells[:, 1], cells[:, 2])
+    order = np.argsort(keys, kind="stable")
+    keys, points, rows, cells = keys[order], points[order], rows[order], cells[order]
+
+    # Candidate pairs (i, j), i < j, from the 27 cells around every vertex.
+    first = []
+    second = []
+    positions = np.arange(len(keys))
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            lo, hi = key_range(
+                keys,
+                encode(cells[:, 0] + dx, cells[:, 1] + dy, cells[:, 2] - 1),
+                encode(cells[:, 0] + dx, cells[:, 1] + dy, cells[:, 2] + 1),
+            )
+            counts = hi - lo
+            if not counts.any():
+                continue
+            i = np.repeat(positions, counts)
+            j = gather_ranges(lo, hi)
+            keep = i < j
+            i, j = i[keep], j[keep]
+            close = np.linalg.norm(points[i] - points[j], axis=1) <= distance
+            first.append(i[close])
+            second.append(j[close])
+
+    if not first:
+        return target
+    first = np.concatenate(first)
+    second = np.concatenate(second)
+    if not len(first):
+        return target
+
+    # Connected components by min-label propagation with pointer jumping.
+    labels = positions.copy()
+    while True:
+        low = np.minimum(labels[first], labels[second])
+        updated = labels.copy()
+        np.minimum.at(updated, first, low)
+        np.minimum.at(updated, second, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+
+    lowest = np.full(len(labels), count, dtype=np.int64)
+    np.minimum.at(lowest, labels, rows)
+    target[rows] = lowest[labels]
+    return target
+
@@ -0,0 +1,150 @@
+"""Geometry kernel shared by the operators: NumPy arrays in, NumPy arrays out.
+
+Nothing here imports ``bpy`` or ``mathutils``, so the module also runs under
+plain CPython for tests and benchmarks. Every function works on a whole batch
+of ``(n, k)`` rows in a few array passes; a single point or segment broadcasts
+against the batch.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def _dot(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.einsum("...i,...i->...", a, b)
+
+
+def transform_points(points, matrix) -> np.ndarray:
+    """Apply the 4x4 affine ``matrix`` to ``(n, 3)`` points."""
+    m = np.asarray(matrix, dtype=np.float64)
+    return np.asarray(points, dtype=np.float64) @ m[:3, :3].T + m[:3, 3]
+
+
+def project_to_region(coords: np.ndarray, matrix, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Project ``(n, 3)`` coordinates into region pixels in one matrix product.
+
+    ``matrix`` is the full 4x4 transform from the coordinate space to clip space,
+    typically ``rv3d.perspective_matrix @ obj.matrix_world``. Returns the ``(n, 2)``
+    region coordinates and a mask of the points in front of the view, mirroring
+    ``view3d_utils.location_3d_to_region_2d``.
+    """
+    m = np.asarray(matrix, dtype=np.float32)
+    clip = coords @ m[:, :3].T + m[:, 3]
+    w = clip[:, 3]
+    valid = w > 0.0
+
+    safe_w = np.where(valid, w, 1.0)
+    width_half = width / 2.0
+    height_half = height / 2.0
+    xy = np.empty((len(coords), 2), dtype=np.float32)
+    xy[:, 0] = width_half + width_half * (clip[:, 0] / safe_w)
+    xy[:, 1] = height_half + height_half * (clip[:, 1] / safe_w)
+    valid &= np.isfinite(xy).all(axis=1)
+    return xy, valid
+
+
+def closest_points_on_segments(points, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Closest point on each segment to ``points`` and its parameter, clamped to [0, 1].
+
+    A zero-length segment gives its start. Works in any dimension and keeps
+    the dtype of the inputs.
+    """
+    ab = ends - starts
+    ap = points - starts
+    ab_len_sq = _dot(ab, ab)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(_dot(ap, ab) / ab_len_sq, 0.0, 1.0)
+    t = np.where(ab_len_sq == 0.0, 0.0, t)
+    return starts + t[..., None] * ab, t
+
+
+def point_segment_distance_sq(points, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Squared distance from ``points`` to the closest point of each segment."""
+    closest, _ = closest_points_on_segments(points, starts, ends)
+    delta = points - closest
+    return _dot(delta, delta)
+
+
+def segment_crossings(start, end, starts: np.ndarray, ends: np.ndarray):
+    """Closest approach of the segment ``start``-``end`` to each of ``starts``-``ends``.
+
+    Returns ``(t, u, dist)``: the unclamped line parameters on the query segment
+    and on each segment, and the distance between those two points. Parallel
+    and degenerate pairs get ``nan`` parameters. ``start`` and ``end`` may also
+    be ``(n, 3)`` batches, paired row by row with the segments.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    d1 = np.asarray(end, dtype=np.float64) - start
+    d2 = ends - starts
+    r = start - starts
+    a = _dot(d1, d1)
+    b = _dot(d2, d1)
+    c = _dot(r, d1)
+    e = _dot(d2, d2)
+    f = _dot(d2, r)
+    denom = a * e - b * b
+
+    valid = denom > 1e-12 * np.maximum(a * e, 1e-30)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(valid, (b * f - c * e) / denom, np.nan)
+        u = np.where(valid, (a * f - b * c) / denom, np.nan)
+    delta = (start + t[..., None] * d1) - (starts + u[..., None] * d2)
+    return t, u, np.sqrt(_dot(delta, delta))
+
+
+def segment_intersections_2d(start, end, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Where the 2D segment ``start``-``end`` crosses each of ``starts``-``ends``.
+
+    Returns ``(s, u, hit)``: the parameters along the query segment and along
+    each segment, and a mask of the pairs that cross with both parameters in
+    [0, 1]. Parallel pairs never cross. ``start`` and ``end`` may also be
+    ``(n, 2)`` batches, paired row by row with the segments.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    d = np.asarray(end, dtype=np.float64) - start
+    e = (ends - starts).astype(np.float64)
+    w = starts - start
+    denom = d[..., 0] * e[..., 1] - d[..., 1] * e[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = (w[..., 0] * e[..., 1] - w[..., 1] * e[..., 0]) / denom
+        u = (w[..., 0] * d[..., 1] - w[..., 1] * d[..., 0]) / denom
+        hit = (denom != 0.0) & (s >= 0.0) & (s <= 1.0) & (u >= 0.0) & (u <= 1.0)
+    return s, u, hit
+
+
+def intersect_lines_plane(origins: np.ndarray, directions: np.ndarray, plane_point,
+                          plane_normal) -> Tuple[np.ndarray, np.ndarray]:
+    """Intersect the lines ``origins + s * directions`` with a plane.
+
+    Returns the ``(n, 3)`` intersection points and a mask of the lines that
+    are not parallel to the plane, like ``mathutils.geometry.intersect_line_plane``.
+    """
+    origins = np.asarray(origins, dtype=np.float64)
+    directions = np.asarray(directions, dtype=np.float64)
+    normal = np.asarray(plane_normal, dtype=np.float64)
+    denom = directions @ normal
+    hit = np.abs(denom) > np.finfo(np.float32).eps
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(hit, (np.asarray(plane_point, dtype=np.float64) - origins) @ normal / denom, 0.0)
+    return origins + s[:, None] * directions, hit
+
+
+def apply_axis_constraint(points, start, axis: int, exclude: bool) -> np.ndarray:
+    """Constrain ``points`` relative to ``start`` along coordinate ``axis``.
+
+    With ``exclude`` the points move in the plane through ``start`` normal to
+    the axis; otherwise they keep only their ``axis`` coordinate and move on
+    the line through ``start`` along it.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    start = np.asarray(start, dtype=np.float64)
+    if exclude:
+        constrained = points.copy()
+        constrained[..., axis] = start[axis]
+    else:
+        constrained = np.broadcast_to(start, points.shape).copy()
+        constrained[..., axis] = points[..., axis]
+    return constrained
@@ -2,4 +2,5 @@
 
 __all__ = [
     "line_tool",
+    "weld_tool",
 ]
@@ -1,20 +1,35 @@
 """CAD-style line drawing operator for LikeCadSketch."""
 
-from __future__ import annotations
-
+import logging
+import time
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 import bpy
 import bmesh
 import gpu
-from bmesh.types import BMVert
+import numpy as np
 from bpy.types import Context, Event
 from bpy_extras import view3d_utils
 from gpu_extras.batch import batch_for_shader
 from mathutils import Matrix, Vector
-from mathutils import geometry as geom
 
+from ..core.draw_lists import DrawListCache, stroke_preview_coords
+from ..core.edge_split import split_edge
+from ..core.faces import fill_loops
+from ..core.mesh_sync import EditMeshSync
+from ..core.picking import PickingCache
+from ..core.profiling import StageProfiler
+from ..core.redraw import RedrawTracker
+from ..core.segment_grid import SegmentGrid, SplitPlan, plan_splits
+from ..core.snap_grid import GridBuildJob, ScreenGrid
+from ..core.snap_index import SnapIndex
+from ..core.stroke import StrokeBuffer
+from ..core.weld import WeldGrid
+from ..geom import apply_axis_constraint, intersect_lines_plane, project_to_region
+
+
+logger = logging.getLogger(__name__)
 
 AXIS_VECTORS = {
     "X": Vector((1.0, 0.0, 0.0)),
@@ -22,6 +37,8 @@ AXIS_VECTORS = {
     "Z": Vector((0.0, 0.0, 1.0)),
 }
 
+SNAP_RADIUS_PX = 10.0
+
 
 @dataclass
 class ConstraintState:
@@ -43,13 +60,33 @@ class SnapState:
     snap_type: Optional[str] = None
     target_world: Optional[Vector] = None
     target_screen: Optional[Vector] = None
+    vertex_row: Optional[int] = None
+    provisional: bool = False
 
     def label(self) -> str:
         if self.snap_type == 'VERTEX':
-            return "Vertex"
-        if self.snap_type == 'MIDPOINT':
-            return "Midpoint"
-        return "None"
+            label = "Vertex"
+        elif self.snap_type == 'MIDPOINT':
+            label = "Midpoint"
+        else:
+            label = "None"
+        return f"{label} (provisional)" if self.provisional else label
+
+
+@dataclass
+class MoveStats:
+    """Counts mouse moves processed versus skipped by coalescing."""
+
+    received: int = 0
+    processed: int = 0
+    skipped_small: int = 0
+    coalesced: int = 0
+
+    def label(self) -> str:
+        return (
+            f"Moves: {self.processed}/{self.received} processed, "
+            f"{self.skipped_small} below threshold, {self.coalesced} coalesced"
+        )
 
 
 class VIEW3D_OT_cad_line(bpy.types.Operator):
@@ -60,6 +97,70 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
     bl_description = "Draw edges with CAD-like snapping, axis locks, and numeric input"
     bl_options = {"REGISTER", "UNDO", "BLOCKING"}
 
+    commit_every: bpy.props.IntProperty(
+        name="Commit Every",
+        description="Number of drawn segments kept in the overlay before they are written to the mesh",
+        default=64,
+        min=1,
+    )
+    split_crossings: bpy.props.BoolProperty(
+        name="Split Crossings",
+        description="Split existing edges where new segments cross them or end on them",
+        default=True,
+    )
+    create_faces: bpy.props.BoolProperty(
+        name="Create Faces",
+        description="Fill planar loops closed by new segments, splitting a face that a segment crosses",
+        default=True,
+    )
+    weld_distance: bpy.props.FloatProperty(
+        name="Weld Distance",
+        description="Reuse the closest existing vertex within this distance instead of adding a new one; "
+                    "snapped vertices are always reused",
+        subtype='DISTANCE',
+        default=0.0,
+        min=0.0,
+    )
+    debug: bpy.props.BoolProperty(
+        name="Debug",
+        description="Show snap index and mouse move statistics in the header",
+        default=False,
+        options={'SKIP_SAVE'},
+    )
+    profile: bpy.props.BoolProperty(
+        name="Profile Stages",
+        description="Time each stage of the tool into latency histograms shown in the sidebar; "
+                    "stages are not timed at all when this is off",
+        default=False,
+        options={'SKIP_SAVE'},
+    )
+    coalesce_moves: bpy.props.BoolProperty(
+        name="Coalesce Mouse Moves",
+        description="Only process the latest mouse move of a burst, at most once per update interval",
+        default=True,
+    )
+    move_threshold: bpy.props.FloatProperty(
+        name="Move Threshold",
+        description="Ignore mouse moves shorter than this distance",
+        subtype='PIXEL',
+        default=1.0,
+        min=0.0,
+    )
+    max_update_rate: bpy.props.FloatProperty(
+        name="Max Update Rate",
+        description="Upper bound for snap and preview updates per second, usually the display refresh rate",
+        default=60.0,
+        min=1.0,
+        max=1000.0,
+    )
+    snap_budget: bpy.props.IntProperty(
+        name="Snap Budget",
+        description="Microseconds of snap indexing per event after the view changed; "
+                    "the rest is refined in the background. Zero disables the budget",
+        default=8000,
+        min=0,
+    )
+
     # ----- lifecycle helpers -------------------------------------------------
     def invoke(self, context: Context, event: Event):
         if context.area.type != "VIEW_3D":
@@ -73,12 +174,20 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
             self.report({"WARNING"}, "Failed to enter Edit Mode")
             return {"CANCELLED"}
 
+        self._area = context.area
+        self._window = context.window
         self._active_obj = context.edit_object
         self._matrix_world = self._active_obj.matrix_world.copy()
         self._matrix_world_inv = self._matrix_world.inverted()
         self._bm = bmesh.from_edit_mesh(self._active_obj.data)
-        self._bm.verts.ensure_lookup_table()
-        self._bm.edges.ensure_lookup_table()
+        self._mesh_sync = EditMeshSync(self._bm, self._active_obj.data)
+        self._mesh_sync.ensure_tables()
+        self._stroke.reset(len(self._bm.verts))
+        self._snap_index = SnapIndex.from_object(self._active_obj)
+        self._picking = PickingCache()
+        self._picking.attach()
+        if self.profile:
+            self._instrument()
 
         self._mouse_region = (event.mouse_region_x, event.mouse_region_y)
         self._update_status_text(context, "Line tool started")
@@ -87,27 +196,30 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         self._draw_handler_3d = bpy.types.SpaceView3D.draw_handler_add(
             self._draw_callback_3d, (context,), 'WINDOW', 'POST_VIEW'
         )
+        if self.coalesce_moves:
+            self._timer = context.window_manager.event_timer_add(
+                1.0 / self.max_update_rate, window=context.window
+            )
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
     def modal(self, context: Context, event: Event):
-        context.area.tag_redraw()
+        result = self._dispatch_event(context, event)
+        if "RUNNING_MODAL" in result:
+            self._request_redraw(context.area)
+        return result
 
+    def _dispatch_event(self, context: Context, event: Event):
         if event.type in {"MIDDLEMOUSE", "WHEELUPMOUSE", "WHEELDOWNMOUSE", "TRACKPADPAN", "TRACKPADZOOM"}:
             return {"PASS_THROUGH"}
 
         if event.type == "MOUSEMOVE":
-            self._mouse_region = (event.mouse_region_x, event.mouse_region_y)
-            self._preview_world = self._constrained_point_from_event(context, event)
-            self._update_status_text(context, "")  # Update for snap status
-
-            if self._snap_state.snap_type == 'VERTEX':
-                context.window.cursor_set('HAND')
-            elif self._snap_state.snap_type == 'MIDPOINT':
-                context.window.cursor_set('PAINT_CROSS')
-            else:
-                context.window.cursor_set('CROSSHAIR')
+            return self._handle_mouse_move(context, event)
 
+        if event.type == "TIMER":
+            if self._pending_move and time.perf_counter() - self._last_move_time >= 1.0 / self.max_update_rate:
+                # Timer events carry the current cursor position, i.e. the newest move.
+                self._process_mouse_move(context, event)
             return {"RUNNING_MODAL"}
 
         if event.type == "LEFTMOUSE" and event.value == "PRESS":
@@ -151,41 +263,75 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         self._finish(context, message="Line tool cancelled")
 
     # ----- event handling ----------------------------------------------------
+    def _handle_mouse_move(self, context: Context, event: Event):
+        stats = self._move_stats
+        stats.received += 1
+
+        last_x, last_y = self._mouse_region
+        dx = event.mouse_region_x - last_x
+        dy = event.mouse_region_y - last_y
+        if dx * dx + dy * dy < self.move_threshold * self.move_threshold:
+            stats.skipped_small += 1
+            return {"RUNNING_MODAL"}
+
+        if self.coalesce_moves and time.perf_counter() - self._last_move_time < 1.0 / self.max_update_rate:
+            # Too soon after the last update: keep only the newest move for the timer to pick up.
+            if self._pending_move:
+                stats.coalesced += 1
+            self._pending_move = True
+            return {"RUNNING_MODAL"}
+
+        if self._pending_move:
+            stats.coalesced += 1
+        self._process_mouse_move(context, event)
+        return {"RUNNING_MODAL"}
+
+    def _process_mouse_move(self, context: Context, event: Event):
+        self._move_stats.processed += 1
+        self._pending_move = False
+        self._last_move_time = time.perf_counter()
+
+        self._mouse_region = (event.mouse_region_x, event.mouse_region_y)
+        self._preview_world = self._constrained_point_from_event(context, event)
+        self._update_status_text(context, "")  # Update for snap status
+        self._update_cursor(context.window)
+
+    def _update_cursor(self, window):
+        snap_type = self._snap_state.snap_type
+        if snap_type == self._cursor_snap_type:
+            return
+        self._cursor_snap_type = snap_type
+
+        if snap_type == 'VERTEX':
+            window.cursor_set('HAND')
+        elif snap_type == 'MIDPOINT':
+            window.cursor_set('PAINT_CROSS')
+        else:
+            window.cursor_set('CROSSHAIR')
+
     def _handle_left_click(self, context: Context, event: Event):
         world_point = self._constrained_point_from_event(context, event)
         if world_point is None:
             return {"RUNNING_MODAL"}
 
-        local_point = self._to_local(world_point)
-
         if self._start_local is None:
-            self._start_vert = self._bm.verts.new(local_point)
-            self._start_local = local_point.copy()
+            self._start_row, world_point = self._resolve_vertex(world_point)
+            self._start_local = self._to_local(world_point)
             self._start_world = world_point.copy()
-            self._bm.verts.ensure_lookup_table()
             self._numeric_input = ""
             self._update_status_text(context, "First point set")
         else:
-            end_local = local_point
             end_world = world_point
             if self._numeric_input:
                 numeric_world = self._resolve_numeric_input()
                 if numeric_world:
                     end_world = numeric_world
-                    end_local = self._to_local(end_world)
-            new_vert = self._bm.verts.new(end_local)
-            self._bm.edges.new((self._start_vert, new_vert))
-            self._bm.verts.ensure_lookup_table()
-            self._bm.edges.ensure_lookup_table()
-            bmesh.update_edit_mesh(self._active_obj.data, loop_triangles=False)
-
-            self._start_vert = new_vert
-            self._start_local = end_local.copy()
-            self._start_world = end_world.copy()
             self._numeric_input = ""
-            self._update_status_text(context, "Segment created – continue or press Esc")
+            if self._append_segment(end_world):
+                self._update_status_text(context, "Segment created – continue or press Esc")
+            else:
+                self._update_status_text(context, "Zero-length segment ignored")
 
-        bmesh.update_edit_mesh(self._active_obj.data, loop_triangles=False)
         return {"RUNNING_MODAL"}
 
     def _handle_confirm_numeric(self, context: Context):
@@ -199,67 +345,312 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
             self._numeric_input = ""
             return {"RUNNING_MODAL"}
 
-        end_local = self._to_local(target_world)
-        new_vert = self._bm.verts.new(end_local)
-        self._bm.edges.new((self._start_vert, new_vert))
-        self._bm.verts.ensure_lookup_table()
-        self._bm.edges.ensure_lookup_table()
-        bmesh.update_edit_mesh(self._active_obj.data, loop_triangles=False)
-
-        self._start_vert = new_vert
-        self._start_local = end_local.copy()
-        self._start_world = target_world.copy()
         self._numeric_input = ""
-        self._update_status_text(context, "Segment created from numeric input")
+        if self._append_segment(target_world):
+            self._update_status_text(context, "Segment created from numeric input")
+        else:
+            self._update_status_text(context, "Zero-length segment ignored")
 
         return {"RUNNING_MODAL"}
 
+    # ----- segment commit ----------------------------------------------------
+    def _resolve_vertex(self, world_point: Vector) -> Tuple[int, Vector]:
+        """Return the row and position of the vertex for ``world_point``.
+
+        A snapped vertex is reused as is; otherwise, with a weld distance, the
+        closest vertex within it is. Only when neither applies is a new vertex
+        buffered.
+        """
+        row = None
+        if self._snap_state.snap_type == 'VERTEX' and self._snap_state.target_world == world_point:
+            row = self._snap_state.vertex_row
+        elif self.weld_distance > 0.0:
+            if self._weld_grid is None:
+                self._weld_grid = WeldGrid.from_targets(self.weld_distance, self._snap_index.vertices)
+            row = self._weld_grid.find(world_point)
+        if row is not None:
+            return row, Vector(self._snap_index.vertices.co(row))
+
+        row = self._stroke.add_vertex(self._to_local(world_point))
+        self._track_new_vertex(world_point)
+        return row, world_point
+
+    def _has_edge(self, row_a: int, row_b: int) -> bool:
+        if self._stroke.has_edge(row_a, row_b):
+            return True
+        if self._stroke.is_new(row_a) or self._stroke.is_new(row_b):
+            return False
+        self._mesh_sync.ensure_tables()
+        return self._bm.edges.get((self._bm.verts[row_a], self._bm.verts[row_b])) is not None
+
+    def _append_segment(self, end_world: Vector) -> bool:
+        """Buffer a segment from the current start point; commit every ``commit_every`` segments.
+
+        Returns ``False`` if the segment would start and end on the same vertex.
+        An edge that already exists is not duplicated, but the chain still moves
+        on to its end.
+        """
+        end_row, end_world = self._resolve_vertex(end_world)
+        if end_row == self._start_row:
+            return False
+
+        if not self._has_edge(self._start_row, end_row):
+            self._stroke.add_edge(self._start_row, end_row, self._start_world, end_world)
+            self._track_new_edge(self._start_world, end_world)
+
+        self._start_row = end_row
+        self._start_local = self._to_local(end_world)
+        self._start_world = end_world.copy()
+        if self._stroke.edge_count >= self.commit_every:
+            self._commit_stroke()
+        return True
+
+    def _commit_stroke(self):
+        """Write the buffered vertices and edges to the bmesh and push a single mesh update.
+
+        With ``split_crossings``, existing edges crossed by the new segments are
+        split first and the new segments are chained through the split vertices.
+        """
+        stroke = self._stroke
+        if not stroke.vert_count and not stroke.edge_count:
+            return
+
+        bm = self._bm
+        base_verts = len(bm.verts)
+        base_edges = len(bm.edges)
+        plan = self._plan_splits() if self.split_crossings and stroke.edge_count else SplitPlan()
+
+        # Look up reused vertices and crossed edges before adding new ones invalidates the lookup table.
+        # The chain start and the snapped vertex are held by reference as well, see the end.
+        self._mesh_sync.ensure_tables()
+        verts = {row: bm.verts[row] for edge in stroke.edges for row in edge if not stroke.is_new(row)}
+        for row in (self._start_row, self._snap_state.vertex_row):
+            if row is not None and not stroke.is_new(row):
+                verts[row] = bm.verts[row]
+        last_vert = bm.verts[base_verts - 1] if base_verts else None
+        last_edge = bm.edges[base_edges - 1] if base_edges else None
+        crossed = [(bm.edges[row], cuts) for row, cuts in plan.edge_cuts.items()]
+
+        point_verts = {}
+        for edge, cuts in crossed:
+            split_verts, _ = split_edge(edge, [u for u, _ in cuts])
+            point_verts.update(zip((point for _, point in cuts), split_verts))
+        for point, (co, row) in enumerate(plan.points):
+            if point not in point_verts:
+                point_verts[point] = bm.verts.new(self._to_local(Vector(co)))
+            if row is not None:
+                verts[row] = point_verts[point]
+        for row, co in enumerate(stroke.points_local, start=stroke.base):
+            if row in verts:
+                # A T junction: the vertex splitting the edge takes the drawn position.
+                verts[row].co = co
+            else:
+                verts[row] = bm.verts.new(co)
+
+        new_edges = []
+        segment_cuts = plan.segment_cuts if plan else [()] * stroke.edge_count
+        for (row_a, row_b), cuts in zip(stroke.edges, segment_cuts):
+            chain = [verts[row_a], *(point_verts[point] for _, point in cuts), verts[row_b]]
+            for v1, v2 in zip(chain, chain[1:]):
+                # Segments drawn back over each other share split points, so a
+                # piece may already exist from an earlier chain.
+                if v1 is v2 or bm.edges.get((v1, v2)) is not None:
+                    continue
+                new_edges.append(bm.edges.new((v1, v2)))
+
+        faces_changed = any(edge.link_faces for edge, _ in crossed)
+        if self.create_faces and fill_loops(bm, new_edges):
+            faces_changed = True
+        self._mesh_sync.mark_geometry(faces=faces_changed)
+
+        # New elements do not always go to the end: splits create vertices among
+        # the stroke's, and BMesh fills slots freed by earlier deletions first,
+        # which renumbers every element after such a slot. Rows are only known
+        # after ``index_update``.
+        bm.verts.index_update()
+        bm.edges.index_update()
+        if (last_vert is not None and last_vert.index != base_verts - 1) or (
+            last_edge is not None and last_edge.index != base_edges - 1
+        ):
+            self._rebuild_indices()
+        else:
+            self._sync_new_elements(base_verts, base_edges, plan.edge_cuts)
+        if self._start_row in verts:
+            self._start_row = verts[self._start_row].index
+        if self._snap_state.vertex_row in verts:
+            self._snap_state.vertex_row = verts[self._snap_state.vertex_row].index
+        stroke.reset(len(bm.verts))
+        self._mesh_sync.flush()
+
+    def _plan_splits(self) -> SplitPlan:
+        if self._segment_grid is None or len(self._segment_grid) != len(self._bm.edges):
+            self._segment_grid = SegmentGrid.from_object(self._active_obj)
+        stroke = self._stroke
+        return plan_splits(
+            self._segment_grid,
+            np.array(stroke.segments_world, dtype=np.float64).reshape(-1, 2, 3),
+            np.array([[stroke.is_new(row) for row in edge] for edge in stroke.edges], dtype=bool).reshape(-1, 2),
+            np.array(stroke.edges, dtype=np.int64).reshape(-1, 2),
+        )
+
+    def _sync_new_elements(self, base_verts: int, base_edges: int, split_rows):
+        """Re-read the elements a commit created or changed into the snap index and segment grid.
+
+        The existing rows below ``base_verts`` / ``base_edges`` kept their index,
+        but the new elements may be in a different order than they were
+        buffered in, so the rows from there on are replaced and the
+        screen-space grids are rebuilt on the next event.
+        """
+        bm = self._bm
+        matrix = self._matrix_world
+        vertices = self._snap_index.vertices
+        midpoints = self._snap_index.midpoints
+        grid = self._segment_grid
+        self._mesh_sync.ensure_tables()
+
+        vertices.truncate(base_verts)
+        for vert in bm.verts[base_verts:]:
+            vertices.append(matrix @ vert.co)
+
+        for row in split_rows:
+            start, end = (matrix @ vert.co for vert in bm.edges[row].verts)
+            midpoints.set(row, (start + end) / 2.0)
+            grid.set(row, start, end)
+        midpoints.truncate(base_edges)
+        for edge in bm.edges[base_edges:]:
+            start, end = (matrix @ vert.co for vert in edge.verts)
+            midpoints.append((start + end) / 2.0)
+            if grid is not None:
+                grid.append(start, end)
+
+        self._snap_grid_key = None
+        self._weld_grid = None
+
+    def _rebuild_indices(self):
+        """Start over from a bulk read after a commit renumbered existing mesh elements."""
+        self._snap_index = SnapIndex.from_object(self._active_obj)
+        self._segment_grid = None
+        self._snap_grid_key = None
+        self._weld_grid = None
+
     # ----- drawing -----------------------------------------------------------
     def _draw_callback_3d(self, context):
-        print("Draw callback 3D called.")
-        if self._start_world and self._preview_world:
-            print(f"Drawing line from {self._start_world} to {self._preview_world}")
-            coords = [self._start_world, self._preview_world]
-            shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            batch = batch_for_shader(shader, 'LINES', {"pos": coords})
-
-            shader.bind()
-            shader.uniform_float("color", (0.0, 0.0, 0.0, 1.0))  # Black
-            gpu.state.line_width_set(2)
-            batch.draw(shader)
-        else:
-            print(f"Not drawing: _start_world={self._start_world}, _preview_world={self._preview_world}")
+        if self._preview_draw.update(self._stroke.preview_segments(), self._start_world, self._preview_world):
+            self._preview_batch = None
+            logger.debug("Preview draw list rebuilt: %s", self._preview_draw.coords)
+
+        coords = self._preview_draw.coords
+        if not coords:
+            return
+
+        if self._shader is None:
+            self._shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        if self._preview_batch is None:
+            self._preview_batch = batch_for_shader(self._shader, 'LINES', {"pos": coords})
+
+        self._shader.bind()
+        self._shader.uniform_float("color", (0.0, 0.0, 0.0, 1.0))  # Black
+        gpu.state.line_width_set(2)
+        self._preview_batch.draw(self._shader)
 
     # ----- helpers -----------------------------------------------------------
+    def _instrument(self):
+        """Time the hot-path stages from now on by routing them through a ``StageProfiler``."""
+        profiler = StageProfiler("Line")
+        for stage, name in (
+            ("snap", "_find_snap_point"),
+            ("constraint", "_apply_constraint_world"),
+            ("status", "_push_status"),
+            ("draw", "_draw_callback_3d"),
+            ("commit", "_commit_stroke"),
+        ):
+            setattr(self, name, profiler.wrap(stage, getattr(self, name)))
+        self._picking.ray_cast = profiler.wrap("ray_cast", self._picking.ray_cast)
+
+    def _request_redraw(self, area):
+        """Tag the viewport only if something drawn for the tool changed."""
+        self._redraw.update(
+            area,
+            self._stroke.edge_count,
+            self._start_world,
+            self._preview_world,
+            self._snap_state.snap_type,
+            self._snap_state.target_world,
+            self._constraint.axis,
+            self._constraint.exclude_axis,
+            self._numeric_input,
+        )
+
     def _finish(self, context: Context, message: str):
         context.window.cursor_set('DEFAULT')
         if self._draw_handler_3d:
             bpy.types.SpaceView3D.draw_handler_remove(self._draw_handler_3d, 'WINDOW')
             self._draw_handler_3d = None
-
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if self._picking:
+            self._picking.detach()
+            self._picking = None
+        if self._snap_tick and bpy.app.timers.is_registered(self._snap_tick):
+            bpy.app.timers.unregister(self._snap_tick)
+        self._snap_tick = None
         if self._bm:
-            bmesh.update_edit_mesh(context.edit_object.data, loop_triangles=False)
+            self._commit_stroke()
+            self._mesh_sync.flush()
+        if self.debug:
+            report = f"{self._move_stats.label()} | {self._redraw.label()}"
+            if self._mesh_sync:
+                report += f" | {self._mesh_sync.label()}"
+            self.report({"INFO"}, report)
 
         self._update_status_text(context, message)
         self._constraint = ConstraintState()
         self._numeric_input = ""
         context.area.header_text_set(None)
+        self._status_text = None
         context.area.tag_redraw()
 
     def _reset_state(self):
         self._bm = None
+        self._mesh_sync = None
         self._active_obj = None
         self._matrix_world = None
         self._matrix_world_inv = None
-        self._start_vert = None
+        self._stroke = StrokeBuffer()
+        self._start_row = None
         self._start_local = None
         self._start_world = None
         self._numeric_input = ""
         self._constraint = ConstraintState()
         self._snap_state = SnapState()
+        self._snap_fallback = None
         self._preview_world = None
         self._mouse_region = (0, 0)
         self._draw_handler_3d = None
+        self._shader = None
+        self._preview_batch = None
+        self._preview_draw = DrawListCache(stroke_preview_coords)
+        self._timer = None
+        self._pending_move = False
+        self._last_move_time = 0.0
+        self._move_stats = MoveStats()
+        self._redraw = RedrawTracker()
+        self._status_text = None
+        self._cursor_snap_type = None
+        self._snap_index = None
+        self._weld_grid = None
+        self._segment_grid = None
+        self._picking = None
+        self._area = None
+        self._window = None
+        self._snap_grid_key = None
+        self._snap_grid_matrix = None
+        self._snap_grid_build_time = 0.0
+        self._snap_view = None
+        self._snap_tick = None
+        self._vert_job = None
+        self._midpoint_job = None
 
     def _ensure_edit_mesh(self, context: Context):
         if context.mode != "OBJECT":
@@ -293,20 +684,16 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         return constrained
 
     def _apply_constraint_world(self, world_point: Vector) -> Vector:
-        local_point = self._to_local(world_point)
-        start_local = self._start_local
-        constrained_local = local_point.copy()
-
-        if self._constraint.axis:
-            axis = self._constraint.axis
-            idx = "XYZ".index(axis)
-            if self._constraint.exclude_axis:
-                constrained_local[idx] = start_local[idx]
-            else:
-                constrained_local = start_local.copy()
-                constrained_local[idx] = local_point[idx]
-
-        constrained_world = self._active_obj.matrix_world @ constrained_local
+        if not self._constraint.axis:
+            # Skip the local-space round trip so a snapped point keeps matching its target exactly.
+            return world_point
+        constrained_local = apply_axis_constraint(
+            self._to_local(world_point),
+            self._start_local,
+            "XYZ".index(self._constraint.axis),
+            self._constraint.exclude_axis,
+        )
+        constrained_world = self._active_obj.matrix_world @ Vector(constrained_local)
         return constrained_world
 
     def _resolve_numeric_input(self) -> Optional[Vector]:
@@ -343,65 +730,153 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         self._constraint.axis = axis
         self._constraint.exclude_axis = shift
 
+    def _ensure_snap_grids(self, region, rv3d, cursor: Tuple[float, float]):
+        """Restart the screen-space snap grids when the view or the mesh changed.
+
+        The grids are filled by ``GridBuildJob``s, nearest chunks to the cursor
+        first. With a snap budget, each call only spends that budget and a
+        ``bpy.app.timers`` tick keeps refining until the jobs are done.
+        """
+        # Buffered stroke points already have rows: they become the next mesh elements on commit.
+        if not self._snap_index.matches(
+            len(self._bm.verts) + self._stroke.vert_count, len(self._bm.edges) + self._stroke.edge_count
+        ):
+            # The mesh was edited outside this operator; start over from a bulk read.
+            self._snap_index = SnapIndex.from_object(self._active_obj)
+            self._weld_grid = None
+            self._snap_grid_key = None
+
+        key = (region.width, region.height, tuple(tuple(row) for row in rv3d.perspective_matrix))
+        if key != self._snap_grid_key:
+            self._snap_grid_matrix = rv3d.perspective_matrix.copy()
+            self._vert_job = GridBuildJob(
+                self._snap_index.vertices, self._snap_grid_matrix, region.width, region.height, cursor, SNAP_RADIUS_PX
+            )
+            self._midpoint_job = GridBuildJob(
+                self._snap_index.midpoints, self._snap_grid_matrix, region.width, region.height, cursor, SNAP_RADIUS_PX
+            )
+            self._snap_grid_key = key
+            self._snap_grid_build_time = 0.0
+            self._snap_view = (region, rv3d)
+
+        if not self._snap_jobs_done():
+            self._advance_snap_jobs()
+            if not self._snap_jobs_done() and self._snap_tick is None:
+                self._snap_tick = self._on_snap_tick
+                bpy.app.timers.register(self._snap_tick, first_interval=0.0)
+
+    def _snap_grid_projected(self) -> int:
+        if self._vert_job is None:
+            return 0
+        return self._vert_job.projected + self._midpoint_job.projected
+
+    def _snap_jobs_done(self) -> bool:
+        return self._vert_job.done and self._midpoint_job.done
+
+    def _advance_snap_jobs(self):
+        start = time.perf_counter()
+        deadline = start + self.snap_budget * 1e-6 if self.snap_budget else float("inf")
+        self._vert_job.step(deadline)
+        self._midpoint_job.step(deadline)
+        self._snap_grid_build_time += time.perf_counter() - start
+
+    def _on_snap_tick(self):
+        """Timer callback: spend another budget slice, then refine a provisional snap."""
+        if self._snap_tick is None:
+            return None
+
+        self._advance_snap_jobs()
+        if self._snap_state.provisional:
+            previous = self._snap_state.target_world
+            region, rv3d = self._snap_view
+            target = self._snap_at(region, rv3d, *self._mouse_region)
+            if target != previous:
+                # A snap the complete grids no longer find falls back to the unsnapped point.
+                target = self._snap_fallback if target is None else target
+                if target is not None:
+                    self._preview_world = target if self._start_local is None else self._apply_constraint_world(target)
+            self._push_status(self._area, "")
+            self._update_cursor(self._window)
+            self._request_redraw(self._area)
+
+        if self._snap_jobs_done():
+            self._snap_tick = None
+            return None
+        return 0.001
+
+    def _add_to_grid(self, grid: ScreenGrid, row: int, world_co: Vector):
+        if self._snap_grid_key is None:
+            return
+        width, height = self._snap_grid_key[:2]
+        xy, valid = project_to_region(np.array([world_co], dtype=np.float32), self._snap_grid_matrix, width, height)
+        if valid[0]:
+            grid.add(row, float(xy[0, 0]), float(xy[0, 1]))
+
+    def _track_new_vertex(self, world_co: Vector):
+        """Add a vertex drawn by the tool to the snap index and the current grid."""
+        row = self._snap_index.vertices.append(world_co)
+        if self._vert_job is not None:
+            self._add_to_grid(self._vert_job.grid, row, world_co)
+        if self._weld_grid is not None:
+            self._weld_grid.add(row, world_co)
+
+    def _track_new_edge(self, start_world: Vector, end_world: Vector):
+        """Add the midpoint of an edge drawn by the tool to the snap index and the current grid."""
+        midpoint_world = (start_world + end_world) / 2.0
+        row = self._snap_index.midpoints.append(midpoint_world)
+        if self._midpoint_job is not None:
+            self._add_to_grid(self._midpoint_job.grid, row, midpoint_world)
+
     def _find_snap_point(self, context: Context, event: Event) -> Optional[Vector]:
         """Find the nearest snap point (vertex or edge midpoint) to the mouse cursor."""
         region = context.region
         rv3d = context.space_data.region_3d
-        mouse_coord = Vector((event.mouse_region_x, event.mouse_region_y))
-        snap_radius = 10.0
+        mouse_x, mouse_y = event.mouse_region_x, event.mouse_region_y
+        self._ensure_snap_grids(region, rv3d, (mouse_x, mouse_y))
+        return self._snap_at(region, rv3d, mouse_x, mouse_y)
+
+    def _snap_at(self, region, rv3d, mouse_x: float, mouse_y: float) -> Optional[Vector]:
+        """Query the snap grids, marking the result provisional while they are incomplete."""
+        vertex_final = self._vert_job.is_final_for(mouse_x, mouse_y)
 
         # --- Vertex Snapping (Highest Priority) ---
-        best_vert_dist = snap_radius
-        snap_vert = None
-        for v in self._bm.verts:
-            if not v.hide:
-                world_pos = self._matrix_world @ v.co
-                screen_pos = view3d_utils.location_3d_to_region_2d(region, rv3d, world_pos)
-                if screen_pos:
-                    dist = (mouse_coord - screen_pos).length
-                    if dist < best_vert_dist:
-                        best_vert_dist = dist
-                        snap_vert = v
-
-        if snap_vert:
+        hit = self._vert_job.grid.nearest(mouse_x, mouse_y, SNAP_RADIUS_PX)
+        if hit is not None:
+            row, screen_x, screen_y = hit
             self._snap_state.snap_type = 'VERTEX'
-            self._snap_state.target_world = self._matrix_world @ snap_vert.co
-            self._snap_state.target_screen = view3d_utils.location_3d_to_region_2d(
-                region, rv3d, self._snap_state.target_world
-            )
+            self._snap_state.vertex_row = row
+            self._snap_state.target_world = Vector(self._snap_index.vertices.co(row))
+            self._snap_state.target_screen = Vector((screen_x, screen_y))
+            self._snap_state.provisional = not vertex_final
             return self._snap_state.target_world
 
+        provisional = not (vertex_final and self._midpoint_job.is_final_for(mouse_x, mouse_y))
+
         # --- Edge Midpoint Snapping ---
-        best_midpoint_dist = snap_radius
-        snap_midpoint_world = None
-        for e in self._bm.edges:
-            if not e.hide:
-                midpoint_local = (e.verts[0].co + e.verts[1].co) / 2.0
-                midpoint_world = self._matrix_world @ midpoint_local
-                screen_pos = view3d_utils.location_3d_to_region_2d(region, rv3d, midpoint_world)
-                if screen_pos:
-                    dist = (mouse_coord - screen_pos).length
-                    if dist < best_midpoint_dist:
-                        best_midpoint_dist = dist
-                        snap_midpoint_world = midpoint_world
-
-        if snap_midpoint_world:
+        hit = self._midpoint_job.grid.nearest(mouse_x, mouse_y, SNAP_RADIUS_PX)
+        if hit is not None:
+            row, screen_x, screen_y = hit
             self._snap_state.snap_type = 'MIDPOINT'
-            self._snap_state.target_world = snap_midpoint_world
-            self._snap_state.target_screen = view3d_utils.location_3d_to_region_2d(
-                region, rv3d, self._snap_state.target_world
-            )
+            self._snap_state.vertex_row = None
+            self._snap_state.target_world = Vector(self._snap_index.midpoints.co(row))
+            self._snap_state.target_screen = Vector((screen_x, screen_y))
+            self._snap_state.provisional = provisional
             return self._snap_state.target_world
 
         # --- No snap found ---
-        self._snap_state = SnapState()
+        self._snap_state = SnapState(provisional=provisional)
         return None
 
     def _location_from_event(self, context: Context, event: Event) -> Optional[Vector]:
         snap_location = self._find_snap_point(context, event)
         if snap_location:
+            # Refinement may still drop a provisional snap; keep the point it would fall back to.
+            self._snap_fallback = self._unsnapped_location(context, event) if self._snap_state.provisional else None
             return snap_location
+        return self._unsnapped_location(context, event)
 
+    def _unsnapped_location(self, context: Context, event: Event) -> Vector:
+        """The surface under the cursor, else the view plane through the 3D cursor."""
         region = context.region
         rv3d = context.space_data.region_3d
         coord = (event.mouse_region_x, event.mouse_region_y)
@@ -409,16 +884,15 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         ray_origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
         ray_target = ray_origin + view_vector * 1000.0
 
-        depsgraph = context.evaluated_depsgraph_get()
-        hit, location, *_ = context.scene.ray_cast(depsgraph, ray_origin, view_vector)
+        hit, location = self._picking.ray_cast(context, ray_origin, view_vector)
         if hit:
             return location
 
         plane_point = context.scene.cursor.location
         plane_normal = (rv3d.view_rotation @ Vector((0.0, 0.0, 1.0))).normalized()
-        intersect = geom.intersect_line_plane(ray_origin, ray_target, plane_point, plane_normal)
-        if intersect is not None:
-            return intersect
+        intersect, hit = intersect_lines_plane([ray_origin], [ray_target - ray_origin], plane_point, plane_normal)
+        if hit[0]:
+            return Vector(intersect[0])
 
         return ray_origin
 
@@ -446,6 +920,17 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         return mapping.get(event.type)
 
     def _update_status_text(self, context: Context, message: str):
+        self._push_status(context.area, message)
+
+    def _push_status(self, area, message: str):
+        """Set the header text, skipping the call when the text did not change."""
+        status = self._format_status(message)
+        if status == self._status_text:
+            return
+        self._status_text = status
+        area.header_text_set(status)
+
+    def _format_status(self, message: str) -> str:
         constraint_label = self._constraint.label()
         snap_label = self._snap_state.label()
 
@@ -461,5 +946,13 @@ class VIEW3D_OT_cad_line(bpy.types.Operator):
         if self._numeric_input:
             parts.append(f"Input: {self._numeric_input}")
 
-        status = " | ".join(parts)
-        context.area.header_text_set(status)
+        if self.debug and self._snap_index is not None:
+            parts.append(
+                f"Index: {len(self._snap_index)} targets, {self._snap_index.build_time * 1000.0:.1f} ms"
+                f" | Grid: {self._snap_grid_projected()}/{len(self._snap_index)} projected,"
+                f" {self._snap_grid_build_time * 1000.0:.1f} ms"
+            )
+            parts.append(self._move_stats.label())
+            parts.append(self._redraw.label())
+
+        return " | ".join(parts)
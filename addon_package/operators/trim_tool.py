@@ -2,9 +2,24 @@
 
 import bpy
 import bmesh
+import gpu
+import numpy as np
 from bpy.types import Context, Event, Operator
 from bpy_extras import view3d_utils
-from mathutils import Vector, geometry
+from gpu_extras.batch import batch_for_shader
+from mathutils import Vector
+
+from ..core.cutting import CuttingEdges, interior_cuts
+from ..core.edge_split import split_edge
+from ..core.mesh_arrays import read_edge_arrays, read_vertex_arrays, renumbered_rows
+from ..core.mesh_sync import EditMeshSync
+from ..core.pick_grid import ScreenSegmentGrid, crossing_segments, nearest_segment
+from ..core.profiling import StageProfiler
+from ..core.redraw import RedrawTracker
+from ..geom import project_to_region, segment_crossings
+
+
+PICK_RADIUS_PX = 10.0
 
 
 class VIEW3D_OT_cad_trim(Operator):
@@ -15,6 +30,29 @@ class VIEW3D_OT_cad_trim(Operator):
     bl_description = "Trim edges based on cutting edges"
     bl_options = {"REGISTER", "UNDO", "BLOCKING"}
 
+    debug: bpy.props.BoolProperty(
+        name="Debug",
+        description="Report redraw statistics when the tool ends",
+        default=False,
+        options={'SKIP_SAVE'},
+    )
+    profile: bpy.props.BoolProperty(
+        name="Profile Stages",
+        description="Time each stage of the tool into latency histograms shown in the sidebar; "
+                    "stages are not timed at all when this is off",
+        default=False,
+        options={'SKIP_SAVE'},
+    )
+    pick_method: bpy.props.EnumProperty(
+        name="Pick Method",
+        description="How the edge under the cursor is found",
+        items=(
+            ('GRID', "Grid", "Index the projected edges once per view; fastest for many clicks in one view"),
+            ('SCAN', "Scan", "Measure every projected edge in one vectorized pass; no index to build"),
+        ),
+        default='GRID',
+    )
+
     def invoke(self, context: Context, event: Event):
         if context.area.type != "VIEW_3D":
             self.report({"WARNING"}, "3D View only")
@@ -22,21 +60,56 @@ class VIEW3D_OT_cad_trim(Operator):
 
         self._state = 'SELECT_CUTTING_EDGES'
         self._cutting_edges = []
+        self._cutting = None
+        self._edit_count = 0
+        self._redraw = RedrawTracker()
         self._active_obj = context.edit_object
         if not self._active_obj or self._active_obj.type != 'MESH':
             self.report({"WARNING"}, "No active mesh object found.")
             return {"CANCELLED"}
 
         self._bm = bmesh.from_edit_mesh(self._active_obj.data)
-        self._bm.edges.ensure_lookup_table()
+        self._mesh_sync = EditMeshSync(self._bm, self._active_obj.data)
+        self._mesh_sync.ensure_tables()
+        # Keep edge ``index`` equal to the row; ``_patch_pick_view`` renumbers after every edit.
+        self._bm.edges.index_update()
+        self._pick_view = None
+        self._pick_grid = None
+        self._pick_key = None
+        self._pick_matrix = None
+        self._fence_start = None
+        self._fence_end = None
+        self._shader = None
+        if self.profile:
+            self._instrument()
+        self._draw_handler = bpy.types.SpaceView3D.draw_handler_add(self._draw_fence, (), 'WINDOW', 'POST_PIXEL')
 
         self.report({"INFO"}, "CAD Trim tool activated. Select cutting edges (Left-click) or Right-click to confirm.")
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
     def modal(self, context: Context, event: Event):
-        context.area.tag_redraw()
-
+        result = self._dispatch_event(context, event)
+        self._mesh_sync.flush()
+        if "RUNNING_MODAL" in result:
+            self._redraw.update(context.area, self._state, self._edit_count, self._fence_start, self._fence_end)
+        elif result & {"FINISHED", "CANCELLED"}:
+            self._finish(context)
+        return result
+
+    def cancel(self, context: Context):
+        self._finish(context)
+
+    def _finish(self, context: Context):
+        if self._draw_handler:
+            bpy.types.SpaceView3D.draw_handler_remove(self._draw_handler, 'WINDOW')
+            self._draw_handler = None
+        if context.area:
+            context.area.tag_redraw()
+        if self.debug:
+            self.report({"INFO"}, f"{self._redraw.label()} | {self._mesh_sync.label()}")
+
+    def _dispatch_event(self, context: Context, event: Event):
         if event.type in {"ESC"}:
             self.report({"INFO"}, "CAD Trim tool cancelled.")
             return {"CANCELLED"}
@@ -52,11 +125,22 @@ class VIEW3D_OT_cad_trim(Operator):
                     self.report({"WARNING"}, "No cutting edges selected. Right-click again to cancel.")
                     return {"CANCELLED"}
                 self._state = 'SELECT_EDGES_TO_TRIM'
-                self.report({"INFO"}, "Cutting edges confirmed. Select edges to trim (Left-click).")
+                self._cutting = CuttingEdges(self._cutting_edges, self._active_obj.matrix_world)
+                self.report({"INFO"}, "Cutting edges confirmed. Click edges to trim, or drag a fence across them from empty space.")
 
         elif self._state == 'SELECT_EDGES_TO_TRIM':
+            mouse = (event.mouse_region_x, event.mouse_region_y)
             if event.type == "LEFTMOUSE" and event.value == "PRESS":
-                self._trim_edge(context, event)
+                # A press on empty space starts a fence instead of trimming one edge.
+                if self._pick_edge_row(context.region, context.space_data.region_3d, *mouse) is None:
+                    self._fence_start = self._fence_end = mouse
+                else:
+                    self._trim_edge(context, event)
+            elif event.type == "MOUSEMOVE" and self._fence_start is not None:
+                self._fence_end = mouse
+            elif event.type == "LEFTMOUSE" and event.value == "RELEASE" and self._fence_start is not None:
+                self._fence_trim(context, self._fence_start, mouse)
+                self._fence_start = self._fence_end = None
             elif event.type == "RIGHTMOUSE" and event.value == "PRESS":
                 self.report({"INFO"}, "CAD Trim tool finished.")
                 return {"FINISHED"}
@@ -67,71 +151,133 @@ class VIEW3D_OT_cad_trim(Operator):
         self.report({"INFO"}, "CAD Trim tool finished.")
         return {"FINISHED"}
 
-    @staticmethod
-    def _closest_point_on_line_segment(p: Vector, a: Vector, b: Vector) -> Vector:
-        ab = b - a
-        ap = p - a
-        proj = ap.dot(ab)
-        ab_len_sq = ab.length_squared
-
-        if ab_len_sq == 0.0:
-            return a
-
-        t = proj / ab_len_sq
-        t = max(0.0, min(1.0, t))
+    def _instrument(self):
+        """Time the hot-path stages from now on by routing them through a ``StageProfiler``."""
+        profiler = StageProfiler("Trim")
+        for stage, name in (
+            ("pick_view", "_ensure_pick_view"),
+            ("pick", "_pick_edge_row"),
+            ("trim", "_trim_edge"),
+            ("fence", "_fence_trim"),
+            ("draw", "_draw_fence"),
+        ):
+            setattr(self, name, profiler.wrap(stage, getattr(self, name)))
+        self._mesh_sync.flush = profiler.wrap("flush", self._mesh_sync.flush)
+
+    def _ensure_pick_view(self, region, rv3d):
+        """Project all visible edges once per view; return ``(starts, ends, rows)``.
+
+        Trims patch the view in place (see ``_patch_pick_view``), so only a
+        view change reads and projects the whole mesh again.
+        """
+        key = (
+            region.width,
+            region.height,
+            tuple(tuple(row) for row in rv3d.perspective_matrix),
+        )
+        if key == self._pick_key:
+            return self._pick_view
+
+        obj = self._active_obj
+        self._mesh_sync.ensure_tables()
+        obj.update_from_editmode()
+        vert_co, _ = read_vertex_arrays(obj.data)
+        edge_verts, edge_hide = read_edge_arrays(obj.data)
+        matrix = rv3d.perspective_matrix @ obj.matrix_world
+        xy, valid = project_to_region(vert_co, matrix, region.width, region.height)
+        rows = np.flatnonzero(valid[edge_verts[:, 0]] & valid[edge_verts[:, 1]] & ~edge_hide)
+        self._pick_view = (xy[edge_verts[rows, 0]], xy[edge_verts[rows, 1]], rows)
+        self._pick_grid = None
+        self._pick_key = key
+        self._pick_matrix = matrix
+        return self._pick_view
+
+    def _patch_pick_view(self, edge_count: int, edits):
+        """Bring the pick view and grid up to date after splitting and trimming edges.
+
+        ``edits`` holds ``(edge, row, pieces)`` for every edge that was split:
+        its row before the edit and the pieces it was split into, deleted
+        ones included. ``edge_count`` is the edge count before the edit. The
+        old entries of the edited edges are dropped, every other row is
+        renumbered and the surviving pieces are projected and added.
+        """
+        edges = self._bm.edges
+        edges.index_update()
+        if self._pick_view is None:
+            return
 
-        closest_point = a + t * ab
-        return closest_point
+        edited = np.array([row for _, row, _ in edits], dtype=np.int64)
+        removed = [row for edge, row, _ in edits if not edge.is_valid]
+        originals = {edge for edge, _, _ in edits}
+        pieces = [piece for _, _, split in edits for piece in split if piece.is_valid]
+        added = [piece.index for piece in pieces if piece not in originals]
+        mapping = renumbered_rows(edge_count, removed, added, len(edges))
+        mapping[edited] = -1
+
+        starts, ends, rows = self._pick_view
+        keep = mapping[rows] >= 0
+        width, height = self._pick_key[0], self._pick_key[1]
+        co = np.array([vert.co for piece in pieces for vert in piece.verts], dtype=np.float32).reshape(-1, 3)
+        xy, valid = project_to_region(co, self._pick_matrix, width, height)
+        valid = valid[0::2] & valid[1::2]
+        new_starts, new_ends = xy[0::2][valid], xy[1::2][valid]
+        new_rows = np.array([piece.index for piece in pieces], dtype=np.int64)[valid]
+
+        self._pick_view = (
+            np.concatenate((starts[keep], new_starts)),
+            np.concatenate((ends[keep], new_ends)),
+            np.concatenate((mapping[rows[keep]], new_rows)),
+        )
+        if self._pick_grid is not None:
+            self._pick_grid.renumber(mapping)
+            self._pick_grid.extend(new_starts, new_ends, new_rows)
+
+    def _pick_edge_row(self, region, rv3d, x: float, y: float):
+        """Row of the edge closest to ``(x, y)`` within ``PICK_RADIUS_PX``, or ``None``."""
+        if self.pick_method == 'SCAN':
+            hit = nearest_segment(x, y, *self._ensure_pick_view(region, rv3d), PICK_RADIUS_PX)
+        else:
+            hit = self._ensure_pick_grid(region, rv3d).nearest(x, y, PICK_RADIUS_PX)
+        return None if hit is None else hit[0]
+
+    def _ensure_pick_grid(self, region, rv3d) -> ScreenSegmentGrid:
+        starts, ends, rows = self._ensure_pick_view(region, rv3d)
+        if self._pick_grid is None:
+            bounds = (-PICK_RADIUS_PX, -PICK_RADIUS_PX, region.width + PICK_RADIUS_PX, region.height + PICK_RADIUS_PX)
+            self._pick_grid = ScreenSegmentGrid(PICK_RADIUS_PX, starts, ends, rows, bounds=bounds)
+        return self._pick_grid
+
+    def _fence_edge_rows(self, region, rv3d, start, end):
+        """Rows of the visible edges crossed by the screen line ``start``-``end``, with the crossing parameter along each."""
+        if self.pick_method == 'SCAN':
+            rows, _, params = crossing_segments(start, end, *self._ensure_pick_view(region, rv3d))
+        else:
+            rows, _, params = self._ensure_pick_grid(region, rv3d).crossing(start, end)
+        return rows, params
 
     def _ray_cast_edge(self, context: Context, event: Event):
         region = context.region
         rv3d = context.space_data.region_3d
         mouse_coord = Vector((event.mouse_region_x, event.mouse_region_y))
 
-        bmesh.update_edit_mesh(self._active_obj.data, loop_triangles=False, destructive=False)
-        self._bm.edges.ensure_lookup_table()
+        row = self._pick_edge_row(region, rv3d, mouse_coord.x, mouse_coord.y)
+        if row is None:
+            return None, None
+        self._mesh_sync.ensure_tables()
+        closest_bmedge = self._bm.edges[row]
 
-        closest_screen_dist_sq = float('inf')
-        closest_bmedge = None
-        screen_threshold_sq = 10 * 10
+        ray_origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, mouse_coord)
+        ray_vector = view3d_utils.region_2d_to_vector_3d(region, rv3d, mouse_coord)
+        ray_target = ray_origin + ray_vector * 10000
 
-        for edge in self._bm.edges:
-            if edge.hide:
-                continue
-            
-            v1_world = self._active_obj.matrix_world @ edge.verts[0].co
-            v2_world = self._active_obj.matrix_world @ edge.verts[1].co
-
-            v1_screen = view3d_utils.location_3d_to_region_2d(region, rv3d, v1_world)
-            v2_screen = view3d_utils.location_3d_to_region_2d(region, rv3d, v2_world)
+        v1_world = self._active_obj.matrix_world @ closest_bmedge.verts[0].co
+        v2_world = self._active_obj.matrix_world @ closest_bmedge.verts[1].co
 
-            if v1_screen is None or v2_screen is None:
-                continue
+        # ``None`` when the view ray runs parallel to the edge.
+        _, edge_params, _ = segment_crossings(ray_origin, ray_target, np.array([v1_world]), np.array([v2_world]))
+        intersect_pt_on_edge = None if np.isnan(edge_params[0]) else v1_world.lerp(v2_world, float(edge_params[0]))
 
-            closest_point_on_screen_edge = self._closest_point_on_line_segment(
-                mouse_coord, v1_screen, v2_screen
-            )
-            dist_sq = (closest_point_on_screen_edge - mouse_coord).length_squared
-            
-            if dist_sq < closest_screen_dist_sq and dist_sq < screen_threshold_sq:
-                closest_screen_dist_sq = dist_sq
-                closest_bmedge = edge
-        
-        if closest_bmedge:
-            ray_origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, mouse_coord)
-            ray_vector = view3d_utils.region_2d_to_vector_3d(region, rv3d, mouse_coord)
-            ray_target = ray_origin + ray_vector * 10000
-
-            v1_world = self._active_obj.matrix_world @ closest_bmedge.verts[0].co
-            v2_world = self._active_obj.matrix_world @ closest_bmedge.verts[1].co
-
-            _, intersect_pt_on_edge = geometry.intersect_line_line(
-                ray_origin, ray_target, v1_world, v2_world
-            )
-            
-            return closest_bmedge, intersect_pt_on_edge
-            
-        return None, None
+        return closest_bmedge, intersect_pt_on_edge
 
     def _select_cutting_edge(self, context: Context, event: Event):
         edge, _ = self._ray_cast_edge(context, event)
@@ -139,10 +285,14 @@ class VIEW3D_OT_cad_trim(Operator):
             if edge not in self._cutting_edges:
                 self._cutting_edges.append(edge)
                 edge.select_set(True)
+                self._mesh_sync.mark_selection()
+                self._edit_count += 1
                 self.report({"INFO"}, f"Cutting edge {edge.index} selected: {len(self._cutting_edges)} edges.")
             else:
                 self._cutting_edges.remove(edge)
                 edge.select_set(False)
+                self._mesh_sync.mark_selection()
+                self._edit_count += 1
                 self.report({"INFO"}, f"Cutting edge {edge.index} deselected: {len(self._cutting_edges)} edges.")
         else:
             self.report({"WARNING"}, "No edge found under mouse.")
@@ -153,103 +303,107 @@ class VIEW3D_OT_cad_trim(Operator):
             self.report({"WARNING"}, "No edge found under mouse to trim.")
             return
 
-        original_v1_co = edge_to_trim.verts[0].co.copy()
-        original_v2_co = edge_to_trim.verts[1].co.copy()
-
-        intersections_with_factors = []
-        for cutting_edge in self._cutting_edges:
-            if cutting_edge == edge_to_trim:
-                continue
-
-            intersection_point = self._get_intersection_point(edge_to_trim, cutting_edge)
-            if intersection_point:
-                edge_vec = original_v2_co - original_v1_co
-                if edge_vec.length_squared == 0.0:
-                    continue
-                factor = (intersection_point - original_v1_co).dot(edge_vec) / edge_vec.length_squared
-                intersections_with_factors.append((factor, intersection_point))
-
-        if not intersections_with_factors:
+        matrix_world = self._active_obj.matrix_world
+        start_world = matrix_world @ edge_to_trim.verts[0].co
+        end_world = matrix_world @ edge_to_trim.verts[1].co
+        direction = end_world - start_world
+        cuts = []
+        if direction.length_squared > 0.0:
+            cuts = interior_cuts(self._cutting.crossings(start_world, end_world, skip=edge_to_trim))
+        if not cuts:
             self.report({"INFO"}, "No intersections found with cutting edges.")
             return
-
-        intersections_with_factors.sort(key=lambda x: x[0])
-        intersection_points = [p for f, p in intersections_with_factors]
-
-        if not edge_to_trim.is_valid:
-            self.report({"ERROR"}, "Edge to trim is invalid before subdivision.")
-            return
-
-        num_cuts = len(intersection_points)
-        if num_cuts == 0:
+        if mouse_world_loc is None:
+            self.report({"WARNING"}, "Could not determine which segment to delete.")
             return
 
-        ret = bmesh.ops.subdivide_edges(self._bm, edges=[edge_to_trim], cuts=num_cuts)
-        
-        new_verts = [v for v in ret['geom_split'] if isinstance(v, bmesh.types.BMVert)]
-        edge_vec_norm = (original_v2_co - original_v1_co).normalized()
-        new_verts.sort(key=lambda v: (v.co - original_v1_co).dot(edge_vec_norm))
-
-        if len(new_verts) == num_cuts:
-            for i, vert in enumerate(new_verts):
-                vert.co = intersection_points[i]
-        else:
-            self.report({"WARNING"}, "Mismatch in number of new vertices and intersection points.")
-
-        all_new_edges = [e for e in ret['geom_split'] if isinstance(e, bmesh.types.BMEdge)]
-        if not all_new_edges:
-            self.report({"WARNING"}, "Edge split did not result in any new edges.")
+        # The pieces are collinear, so the one closest to the click is the one containing its parameter.
+        click = (mouse_world_loc - start_world).dot(direction) / direction.length_squared
+        piece = sum(1 for t, _ in cuts if t < click)
+
+        has_faces = bool(edge_to_trim.link_faces)
+        edge_count = len(self._bm.edges)
+        row = edge_to_trim.index
+        _, segments = split_edge(edge_to_trim, [t for t, _ in cuts])
+        bmesh.ops.delete(self._bm, geom=[segments[piece]], context='EDGES')
+        self._mesh_sync.mark_geometry(faces=has_faces)
+        self._patch_pick_view(edge_count, [(edge_to_trim, row, segments)])
+        self._edit_count += 1
+        self.report({"INFO"}, "Edge successfully trimmed.")
+
+        if edge_to_trim in self._cutting:
+            # A cutting edge was trimmed: refresh its snapshot, or drop it if it was the deleted piece.
+            self._cutting.refresh(edge_to_trim, matrix_world)
+            if not edge_to_trim.is_valid:
+                self._cutting_edges.remove(edge_to_trim)
+
+    def _fence_trim(self, context: Context, start, end):
+        """Trim every edge the fence ``start``-``end`` crosses in one bmesh edit.
+
+        Each crossed edge is cut at all its crossings with the cutting edges and
+        the piece under the fence is deleted, as if it had been clicked. All cuts
+        are planned before the mesh changes, then the edges are split and the
+        pieces deleted together, followed by a single mesh update.
+        """
+        if start == end:
+            self.report({"WARNING"}, "No edge found under mouse to trim.")
             return
 
-        edge_to_delete = None
-        min_dist_sq_to_click = float('inf')
-
-        for edge_segment in all_new_edges:
-            if not edge_segment.is_valid:
+        region = context.region
+        rv3d = context.space_data.region_3d
+        rows, fence_params = self._fence_edge_rows(region, rv3d, start, end)
+        self._mesh_sync.ensure_tables()
+        matrix_world = self._active_obj.matrix_world
+
+        plans = []
+        for row, fence_param in zip(rows, fence_params):
+            edge = self._bm.edges[row]
+            start_world = matrix_world @ edge.verts[0].co
+            end_world = matrix_world @ edge.verts[1].co
+            cuts = interior_cuts(self._cutting.crossings(start_world, end_world, skip=edge))
+            if not cuts:
                 continue
+            # The fence crossing is measured on screen, so compare it with the cuts projected the same way.
+            points = np.array([start_world, end_world, *(point for _, point in cuts)], dtype=np.float64)
+            xy, _ = project_to_region(points, rv3d.perspective_matrix, region.width, region.height)
+            direction = xy[1] - xy[0]
+            cut_params = (xy[2:] - xy[0]) @ direction / max(float(direction @ direction), 1e-12)
+            plans.append((edge, [t for t, _ in cuts], int(np.count_nonzero(cut_params < fence_param))))
+
+        if not plans:
+            self.report({"INFO"}, "The fence crossed no edges with cutting edge intersections.")
+            return
 
-            v1_world = self._active_obj.matrix_world @ edge_segment.verts[0].co
-            v2_world = self._active_obj.matrix_world @ edge_segment.verts[1].co
-            
-            closest_point_on_segment = self._closest_point_on_line_segment(
-                mouse_world_loc, v1_world, v2_world
-            )
-            dist_sq = (closest_point_on_segment - mouse_world_loc).length_squared
-            
-            if dist_sq < min_dist_sq_to_click:
-                min_dist_sq_to_click = dist_sq
-                edge_to_delete = edge_segment
-        
-        if edge_to_delete and edge_to_delete.is_valid:
-            bmesh.ops.delete(self._bm, geom=[edge_to_delete], context='EDGES')
-            self.report({"INFO"}, "Edge successfully trimmed.")
-        else:
-            self.report({"WARNING"}, "Could not determine which segment to delete.")
-
-        bmesh.update_edit_mesh(self._active_obj.data)
-        self._bm.edges.ensure_lookup_table()
-        context.area.tag_redraw()
-
-    @classmethod
-    def _get_intersection_point(cls, edge1, edge2) -> Vector | None:
-        obj = bpy.context.edit_object
-        matrix_world = obj.matrix_world
-
-        e1_v1_world = matrix_world @ edge1.verts[0].co
-        e1_v2_world = matrix_world @ edge1.verts[1].co
-        e2_v1_world = matrix_world @ edge2.verts[0].co
-        e2_v2_world = matrix_world @ edge2.verts[1].co
-
-        p1, p2 = geometry.intersect_line_line(e1_v1_world, e1_v2_world, e2_v1_world, e2_v2_world)
-
-        EPSILON = 0.0001
-
-        if (p1 - p2).length_squared < EPSILON:
-            on_segment1 = (p1 - e1_v1_world).length_squared + (p1 - e1_v2_world).length_squared \
-                          <= (e1_v1_world - e1_v2_world).length_squared + EPSILON
-            on_segment2 = (p1 - e2_v1_world).length_squared + (p1 - e2_v2_world).length_squared \
-                          <= (e2_v1_world - e2_v2_world).length_squared + EPSILON
-
-            if on_segment1 and on_segment2:
-                return p1
-        return None
+        has_faces = False
+        pieces = []
+        edits = []
+        edge_count = len(self._bm.edges)
+        for edge, factors, piece in plans:
+            has_faces |= bool(edge.link_faces)
+            row = edge.index
+            _, segments = split_edge(edge, factors)
+            pieces.append(segments[piece])
+            edits.append((edge, row, segments))
+        bmesh.ops.delete(self._bm, geom=pieces, context='EDGES')
+        self._mesh_sync.mark_geometry(faces=has_faces)
+        self._patch_pick_view(edge_count, edits)
+        self._edit_count += 1
+
+        for edge, _, _ in plans:
+            if edge in self._cutting:
+                self._cutting.refresh(edge, matrix_world)
+                if not edge.is_valid:
+                    self._cutting_edges.remove(edge)
+        self.report({"INFO"}, f"Fence trimmed {len(pieces)} edges.")
+
+    def _draw_fence(self):
+        if self._fence_start is None or self._fence_start == self._fence_end:
+            return
+        if self._shader is None:
+            self._shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+        coords = [tuple(map(float, self._fence_start)), tuple(map(float, self._fence_end))]
+        batch = batch_for_shader(self._shader, 'LINES', {"pos": coords})
+        self._shader.bind()
+        self._shader.uniform_float("color", (0.0, 0.0, 0.0, 1.0))  # Black
+        gpu.state.line_width_set(1)
+        batch.draw(self._shader)
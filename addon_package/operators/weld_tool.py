@@ -0,0 +1,53 @@
+"""Bulk vertex welding for LikeCadSketch drawings."""
+
+import bmesh
+import bpy
+import numpy as np
+from bpy.types import Context, Operator
+
+from ..core.mesh_arrays import read_vertex_arrays
+from ..core.weld import weld_map
+
+
+class VIEW3D_OT_cad_weld(Operator):
+    """Merge coincident vertices left by earlier drawings."""
+
+    bl_idname = "view3d.cad_weld"
+    bl_label = "CAD Weld"
+    bl_description = "Merge visible vertices closer than the weld distance"
+    bl_options = {"REGISTER", "UNDO"}
+
+    distance: bpy.props.FloatProperty(
+        name="Distance",
+        description="Vertices closer than this, in world space, are merged into one",
+        subtype='DISTANCE',
+        default=0.0001,
+        min=0.0,
+    )
+
+    @classmethod
+    def poll(cls, context: Context):
+        obj = context.edit_object
+        return obj is not None and obj.type == 'MESH'
+
+    def execute(self, context: Context):
+        obj = context.edit_object
+        obj.update_from_editmode()
+        co, hide = read_vertex_arrays(obj.data)
+        matrix = np.asarray(obj.matrix_world, dtype=np.float32)
+        world_co = co @ matrix[:3, :3].T + matrix[:3, 3]
+
+        target = weld_map(world_co, self.distance, ~hide)
+        merged = np.flatnonzero(target != np.arange(len(target)))
+        if not len(merged):
+            self.report({"INFO"}, "No vertices to weld.")
+            return {"CANCELLED"}
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+        verts = bm.verts
+        bmesh.ops.weld_verts(bm, targetmap={verts[i]: verts[target[i]] for i in merged.tolist()})
+        bmesh.update_edit_mesh(obj.data)
+
+        self.report({"INFO"}, f"Welded {len(merged)} vertices.")
+        return {"FINISHED"}
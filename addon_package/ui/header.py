@@ -15,6 +15,7 @@ def draw_header_button(self, context):
     row.enabled = is_mesh_context
     row.operator("view3d.cad_line", text="Line", icon="MESH_DATA")
     row.operator("view3d.cad_trim", text="Trim", icon="TRASH")
+    row.operator("view3d.cad_weld", text="Weld", icon="AUTOMERGE_ON")
 
 
 def register():
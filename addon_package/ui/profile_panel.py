@@ -0,0 +1,90 @@
+"""Sidebar panel with the stage timings of profiled tool sessions."""
+
+import bpy
+
+from ..core import profiling
+
+
+# One character per histogram bucket, from empty to the fullest bucket.
+_RAMP = " .:-=+*#"
+
+
+def _histogram_text(counts) -> str:
+    peak = max(counts.max(), 1)
+    return "".join(_RAMP[(len(_RAMP) - 1) * count // peak] for count in counts.tolist())
+
+
+class VIEW3D_OT_cad_profile_export(bpy.types.Operator):
+    """Write the stage timings of the last profiled tool sessions to a CSV file"""
+
+    bl_idname = "view3d.cad_profile_export"
+    bl_label = "Export Profile CSV"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+
+    @classmethod
+    def poll(cls, context):
+        return bool(profiling.sessions)
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "cad_sketch_profile.csv"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        try:
+            profiling.write_csv(bpy.path.abspath(self.filepath), profiling.sessions.values())
+        except OSError as exc:
+            self.report({"ERROR"}, f"Could not write profile: {exc}")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Profile written to {self.filepath}")
+        return {"FINISHED"}
+
+
+class VIEW3D_PT_cad_profile(bpy.types.Panel):
+    """Per-stage latency of the last profiled Line and Trim sessions."""
+
+    bl_label = "Profile"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "CAD Sketch"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        row.operator("view3d.cad_line", text="Line", icon="MESH_DATA").profile = True
+        row.operator("view3d.cad_trim", text="Trim", icon="TRASH").profile = True
+
+        if not profiling.sessions:
+            layout.label(text="Start a tool above to record its stages.")
+            return
+
+        for tool, profiler in profiling.sessions.items():
+            box = layout.box()
+            box.label(text=tool)
+            col = box.column(align=True)
+            for stage, calls, p50, p95, worst in profiler.rows():
+                split = col.split(factor=0.3)
+                split.label(text=f"{stage} ({calls})")
+                split.label(text=f"{p50:.2f} / {p95:.2f} / {worst:.2f} ms")
+                col.label(text=f"[{_histogram_text(profiler.stages[stage].histogram())}]")
+        layout.label(text="p50 / p95 / max; histogram from <0.05 ms to >=100 ms")
+        layout.operator("view3d.cad_profile_export", icon="EXPORT")
+
+
+classes = (
+    VIEW3D_OT_cad_profile_export,
+    VIEW3D_PT_cad_profile,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,80 @@
+"""Helpers shared by the benchmark scripts: generated meshes, a synthetic view and timers.
+
+The scripts put the repository root on ``sys.path`` before importing this
+module, so it is imported as ``benchmarks.common``.
+"""
+
+import time
+from types import SimpleNamespace
+
+import bpy
+import numpy as np
+from mathutils import Matrix
+
+
+def mesh_from_points(name: str, co: np.ndarray):
+    """A mesh with the ``(n, 3)`` vertices ``co`` and no edges."""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", np.asarray(co, dtype=np.float32).ravel())
+    mesh.update()
+    return mesh
+
+
+def mesh_from_edges(name: str, starts: np.ndarray, ends: np.ndarray):
+    """A mesh of separate edges ``starts[i]``-``ends[i]``; edge ``i`` uses vertices ``i`` and ``n + i``."""
+    count = len(starts)
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(2 * count)
+    mesh.vertices.foreach_set("co", np.concatenate((starts, ends)).astype(np.float32).ravel())
+    mesh.edges.add(count)
+    edge_verts = np.stack((np.arange(count), np.arange(count) + count), axis=1).astype(np.int32)
+    mesh.edges.foreach_set("vertices", edge_verts.ravel())
+    mesh.update()
+    return mesh
+
+
+def axis_aligned_edges(rng, count: int, lengths, axes):
+    """``(starts, ends)`` of ``count`` edges on the z = 0 plane inside the -50..50 square.
+
+    Edge ``i`` runs ``lengths[i]`` along X or Y as given by ``axes[i]`` (0 or 1);
+    both may also be scalars.
+    """
+    lengths = np.broadcast_to(np.asarray(lengths, dtype=np.float32), (count,))
+    starts = rng.uniform(-50.0, 50.0 - float(lengths.max()), size=(count, 3)).astype(np.float32)
+    starts[:, 2] = 0.0
+    ends = starts.copy()
+    ends[np.arange(count), np.broadcast_to(axes, (count,))] += lengths
+    return starts, ends
+
+
+def make_view(width: int = 1920, height: int = 1080):
+    """``(region, rv3d)`` of an orthographic top view of the -50..50 square filling the region."""
+    view_matrix = Matrix.Translation((0.0, 0.0, -100.0))
+    window_matrix = Matrix.Diagonal((1.0 / 50.0, 1.0 / 50.0, -1.0 / 1000.0, 1.0))
+    rv3d = SimpleNamespace(
+        is_perspective=False,
+        view_perspective='ORTHO',
+        view_matrix=view_matrix,
+        perspective_matrix=window_matrix @ view_matrix,
+        view_rotation=view_matrix.inverted().to_quaternion(),
+    )
+    return SimpleNamespace(width=width, height=height), rv3d
+
+
+def timed(func, *args) -> float:
+    """Seconds taken by one call of ``func(*args)``."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def best_of(func, *args, repeat: int = 5):
+    """``(seconds, result)`` of the fastest of ``repeat`` calls."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
@@ -0,0 +1,86 @@
+"""Compare the per-vertex snap loop with the batched NumPy path.
+
+Run headless with::
+
+    blender --background --python benchmarks/snap_projection.py -- 200000
+"""
+
+import os
+import sys
+
+import bmesh
+import bpy
+import numpy as np
+from bpy_extras import view3d_utils
+from mathutils import Matrix, Vector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from addon_package.core.mesh_arrays import read_vertex_arrays  # noqa: E402
+from addon_package.core.snap_grid import ScreenGrid  # noqa: E402
+from addon_package.geom import project_to_region  # noqa: E402
+from benchmarks.common import best_of, make_view, mesh_from_points  # noqa: E402
+
+
+SNAP_RADIUS_PX = 10.0
+
+
+def _make_mesh(count: int):
+    rng = np.random.default_rng(0)
+    co = rng.uniform(-50.0, 50.0, size=(count, 3)).astype(np.float32)
+    co[:, 2] = 0.0
+    return mesh_from_points("SnapBenchmark", co)
+
+
+def _old_loop(bm, matrix_world, region, rv3d, mouse):
+    best_dist = SNAP_RADIUS_PX
+    best = None
+    for v in bm.verts:
+        if v.hide:
+            continue
+        screen_pos = view3d_utils.location_3d_to_region_2d(region, rv3d, matrix_world @ v.co)
+        if screen_pos is not None:
+            dist = (mouse - screen_pos).length
+            if dist < best_dist:
+                best_dist = dist
+                best = v.index
+    return best
+
+
+def _new_path(mesh, matrix_world, region, rv3d, mouse):
+    co, hide = read_vertex_arrays(mesh)
+    ids = np.flatnonzero(~hide)
+    xy, valid = project_to_region(co[ids], rv3d.perspective_matrix @ matrix_world, region.width, region.height)
+    rows = np.flatnonzero(valid)
+    grid = ScreenGrid(SNAP_RADIUS_PX, xy[rows], rows)
+    hit = grid.nearest(mouse.x, mouse.y, SNAP_RADIUS_PX)
+    return None if hit is None else int(ids[hit[0]])
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    counts = [int(arg) for arg in argv] or [10_000, 50_000, 200_000]
+
+    matrix_world = Matrix.Identity(4)
+    region, rv3d = make_view()
+    mouse = Vector((region.width / 2.0 + 3.0, region.height / 2.0 - 2.0))
+
+    for count in counts:
+        mesh = _make_mesh(count)
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bm.verts.index_update()
+
+        old_time, old_hit = best_of(_old_loop, bm, matrix_world, region, rv3d, mouse)
+        new_time, new_hit = best_of(_new_path, mesh, matrix_world, region, rv3d, mouse)
+        print(
+            f"{count:>8} verts | loop {old_time * 1000.0:9.2f} ms | batched {new_time * 1000.0:8.2f} ms"
+            f" | speedup {old_time / new_time:6.1f}x | same hit: {old_hit == new_hit}"
+        )
+
+        bm.free()
+        bpy.data.meshes.remove(mesh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Latency of the snap, pick, trim and commit hot paths on generated meshes.
+
+Each stage calls the operator's own method on a stand-in instance with a
+synthetic region and top view, so no window or modal session is needed.
+Run headless with::
+
+    blender --background --python benchmarks/suite.py -- --sizes 1000 100000 --output results.json
+
+Compare against a saved run; the process exits with status 1 if any stage
+got slower than the baseline by more than the threshold::
+
+    blender --background --python benchmarks/suite.py -- --output new.json --baseline results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import bmesh
+import bpy
+import numpy as np
+from mathutils import Vector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from addon_package.core.cutting import CuttingEdges  # noqa: E402
+from addon_package.core.mesh_sync import EditMeshSync  # noqa: E402
+from addon_package.core.picking import PickingCache  # noqa: E402
+from addon_package.core.snap_index import SnapIndex  # noqa: E402
+from addon_package.geom import project_to_region  # noqa: E402
+from addon_package.operators.line_tool import VIEW3D_OT_cad_line  # noqa: E402
+from addon_package.operators.trim_tool import VIEW3D_OT_cad_trim  # noqa: E402
+from benchmarks.common import axis_aligned_edges, make_view, mesh_from_edges, timed  # noqa: E402
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+STAGES = ("snap_build", "snap", "location", "commit", "pick", "trim")
+
+
+def _make_object(count: int):
+    """``count`` axis-aligned edges over a 100 x 100 area, about two crossings per edge, in edit mode."""
+    rng = np.random.default_rng(0)
+    # Even edges run along X, odd edges along Y.
+    starts, ends = axis_aligned_edges(rng, count, 200.0 / np.sqrt(count), np.arange(count) % 2)
+    mesh = mesh_from_edges("SuiteBenchmark", starts, ends)
+
+    obj = bpy.data.objects.new("SuiteBenchmark", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    bpy.ops.object.mode_set(mode='EDIT')
+    return obj
+
+
+def _remove_object(obj):
+    bpy.ops.object.mode_set(mode='OBJECT')
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+
+
+def _make_context(width: int = 1920, height: int = 1080):
+    """A context with an orthographic top view of the -50..50 square filling the region."""
+    region, rv3d = make_view(width, height)
+    return SimpleNamespace(
+        region=region,
+        space_data=SimpleNamespace(region_3d=rv3d),
+        scene=bpy.context.scene,
+        visible_objects=bpy.context.visible_objects,
+        evaluated_depsgraph_get=bpy.context.evaluated_depsgraph_get,
+    )
+
+
+def _event(x: float, y: float):
+    return SimpleNamespace(mouse_region_x=int(x), mouse_region_y=int(y))
+
+
+def _harness(operator_class, **props):
+    """An object with ``operator_class``'s methods and property defaults, usable without a modal session."""
+    namespace = {name: value for name, value in vars(operator_class).items() if not name.startswith("__")}
+    namespace["report"] = lambda self, level, message: None
+    harness = type(f"{operator_class.__name__}Harness", (), namespace)()
+    for name, prop in getattr(operator_class, "__annotations__", {}).items():
+        setattr(harness, name, prop.keywords.get("default"))
+    for name, value in props.items():
+        setattr(harness, name, value)
+    return harness
+
+
+def _setup_line(obj):
+    """The state ``VIEW3D_OT_cad_line.invoke`` sets up, minus cursor, timers and draw handlers."""
+    line = _harness(VIEW3D_OT_cad_line, snap_budget=0, commit_every=1 << 30)
+    line._reset_state()
+    line._active_obj = obj
+    line._matrix_world = obj.matrix_world.copy()
+    line._matrix_world_inv = line._matrix_world.inverted()
+    line._bm = bmesh.from_edit_mesh(obj.data)
+    line._mesh_sync = EditMeshSync(line._bm, obj.data)
+    line._mesh_sync.ensure_tables()
+    line._stroke.reset(len(line._bm.verts))
+    line._snap_index = SnapIndex.from_object(obj)
+    line._picking = PickingCache()
+    return line
+
+
+def _setup_trim(obj, cutting_edges):
+    """The state of ``VIEW3D_OT_cad_trim`` after the cutting edges were confirmed."""
+    trim = _harness(VIEW3D_OT_cad_trim)
+    trim._state = 'SELECT_EDGES_TO_TRIM'
+    trim._edit_count = 0
+    trim._active_obj = obj
+    trim._bm = bmesh.from_edit_mesh(obj.data)
+    trim._mesh_sync = EditMeshSync(trim._bm, obj.data)
+    trim._mesh_sync.ensure_tables()
+    trim._bm.edges.index_update()
+    trim._pick_view = None
+    trim._pick_grid = None
+    trim._pick_key = None
+    trim._pick_matrix = None
+    trim._fence_start = None
+    trim._fence_end = None
+    trim._cutting_edges = list(cutting_edges)
+    trim._cutting = CuttingEdges(trim._cutting_edges, obj.matrix_world)
+    return trim
+
+
+def _trim_click(trim, context, event):
+    """One trim click as the modal handler runs it: trim, then push the mesh update."""
+    trim._trim_edge(context, event)
+    trim._mesh_sync.flush()
+
+
+def _summary(timings):
+    ms = np.array(timings) * 1000.0
+    return {
+        "n": len(ms),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+    }
+
+
+def run_size(count: int, samples: int, segments_per_commit: int) -> dict:
+    rng = np.random.default_rng(1)
+    obj = _make_object(count)
+    context = _make_context()
+    region = context.region
+    rv3d = context.space_data.region_3d
+    mice = rng.uniform((0.0, 0.0), (region.width, region.height), size=(samples, 2))
+    timings = {stage: [] for stage in STAGES}
+
+    line = _setup_line(obj)
+    for _ in range(3):
+        line._snap_grid_key = None
+        timings["snap_build"].append(timed(line._find_snap_point, context, _event(*mice[0])))
+    for x, y in mice:
+        timings["snap"].append(timed(line._find_snap_point, context, _event(x, y)))
+    for x, y in mice:
+        timings["location"].append(timed(line._location_from_event, context, _event(x, y)))
+
+    # Short random walks that cross existing edges, so commits also split them.
+    step = 400.0 / np.sqrt(count)
+    point = Vector((0.0, 0.0, 0.0))
+    line._start_row, line._start_world = line._resolve_vertex(point)
+    line._start_local = line._to_local(line._start_world)
+    for _ in range(samples):
+        for _ in range(segments_per_commit):
+            offset = rng.uniform(-step, step, size=2)
+            point = Vector((float(np.clip(point.x + offset[0], -50.0, 50.0)),
+                            float(np.clip(point.y + offset[1], -50.0, 50.0)), 0.0))
+            line._append_segment(point)
+        timings["commit"].append(timed(line._commit_stroke))
+
+    # Cut the X edges with the Y edges; click a quarter along X edges spread over the mesh.
+    bm = line._bm
+    bm.edges.ensure_lookup_table()
+    trim = _setup_trim(obj, (bm.edges[row] for row in range(1, count, 2)))
+    targets = rng.choice(np.arange(0, count, 2), size=min(samples, count // 2), replace=False)
+    coords = np.array(
+        [tuple(obj.matrix_world @ bm.edges[row].verts[0].co.lerp(bm.edges[row].verts[1].co, 0.25))
+         for row in targets],
+        dtype=np.float32,
+    )
+    clicks, _ = project_to_region(coords, rv3d.perspective_matrix, region.width, region.height)
+    for x, y in clicks:
+        timings["pick"].append(timed(trim._ray_cast_edge, context, _event(x, y)))
+    for x, y in clicks:
+        timings["trim"].append(timed(_trim_click, trim, context, _event(x, y)))
+
+    _remove_object(obj)
+    return {stage: _summary(values) for stage, values in timings.items()}
+
+
+def compare(results: dict, baseline: dict, threshold: float, metric: str) -> list:
+    """Return ``(size, stage, before, after)`` for every stage slower than ``baseline`` by more than ``threshold``."""
+    regressions = []
+    for size, stages in results["sizes"].items():
+        for stage, stats in stages.items():
+            before = baseline.get("sizes", {}).get(size, {}).get(stage)
+            if before is None:
+                continue
+            if stats[metric] > before[metric] * (1.0 + threshold):
+                regressions.append((size, stage, before[metric], stats[metric]))
+    return regressions
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="suite.py", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Edge counts to generate")
+    parser.add_argument("--samples", type=int, default=200, help="Timed calls per stage")
+    parser.add_argument("--segments-per-commit", type=int, default=8, help="Segments buffered before each commit")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--metric", choices=("p50_ms", "p95_ms"), default="p50_ms", help="Statistic compared")
+    args = parser.parse_args(argv)
+
+    results = {"blender": bpy.app.version_string, "samples": args.samples, "sizes": {}}
+    for count in args.sizes:
+        stages = run_size(count, args.samples, args.segments_per_commit)
+        results["sizes"][str(count)] = stages
+        print(f"{count:>8} edges | " + " | ".join(
+            f"{stage} {stats['p50_ms']:.3f}/{stats['p95_ms']:.3f} ms" for stage, stats in stages.items()
+        ))
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold, args.metric)
+        for size, stage, before, after in regressions:
+            print(f"REGRESSION {size} edges, {stage}: {args.metric} {before:.3f} -> {after:.3f} ms")
+        if regressions:
+            sys.exit(1)
+        print(f"No stage regressed by more than {args.threshold:.0%} ({args.metric}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare the per-edge trim picking loop with the vectorized scan and the segment grid.
+
+Run headless with::
+
+    blender --background --python benchmarks/trim_picking.py -- 100000
+"""
+
+import os
+import sys
+
+import bmesh
+import bpy
+import numpy as np
+from bpy_extras import view3d_utils
+from mathutils import Matrix, Vector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from addon_package.core.mesh_arrays import read_edge_arrays, read_vertex_arrays  # noqa: E402
+from addon_package.core.pick_grid import ScreenSegmentGrid, nearest_segment  # noqa: E402
+from addon_package.geom import project_to_region  # noqa: E402
+from benchmarks.common import axis_aligned_edges, best_of, make_view, mesh_from_edges  # noqa: E402
+
+
+PICK_RADIUS_PX = 10.0
+
+
+def _make_mesh(count: int):
+    """A floor-plan-like mesh: ``count`` short axis-aligned edges scattered over the view."""
+    rng = np.random.default_rng(0)
+    lengths = rng.uniform(0.1, 2.0, size=count)
+    axes = rng.integers(0, 2, size=count)
+    return mesh_from_edges("PickBenchmark", *axis_aligned_edges(rng, count, lengths, axes))
+
+
+def _closest_point_on_line_segment(p, a, b):
+    ab = b - a
+    ab_len_sq = ab.length_squared
+    if ab_len_sq == 0.0:
+        return a
+    t = max(0.0, min(1.0, (p - a).dot(ab) / ab_len_sq))
+    return a + t * ab
+
+
+def _old_loop(bm, matrix_world, region, rv3d, mouse):
+    closest_screen_dist_sq = float('inf')
+    closest = None
+    screen_threshold_sq = PICK_RADIUS_PX * PICK_RADIUS_PX
+    for edge in bm.edges:
+        if edge.hide:
+            continue
+        v1_screen = view3d_utils.location_3d_to_region_2d(region, rv3d, matrix_world @ edge.verts[0].co)
+        v2_screen = view3d_utils.location_3d_to_region_2d(region, rv3d, matrix_world @ edge.verts[1].co)
+        if v1_screen is None or v2_screen is None:
+            continue
+        dist_sq = (_closest_point_on_line_segment(mouse, v1_screen, v2_screen) - mouse).length_squared
+        if dist_sq < closest_screen_dist_sq and dist_sq < screen_threshold_sq:
+            closest_screen_dist_sq = dist_sq
+            closest = edge.index
+    return closest
+
+
+def _project(mesh, matrix_world, region, rv3d):
+    vert_co, _ = read_vertex_arrays(mesh)
+    edge_verts, edge_hide = read_edge_arrays(mesh)
+    xy, valid = project_to_region(vert_co, rv3d.perspective_matrix @ matrix_world, region.width, region.height)
+    rows = np.flatnonzero(valid[edge_verts[:, 0]] & valid[edge_verts[:, 1]] & ~edge_hide)
+    return xy[edge_verts[rows, 0]], xy[edge_verts[rows, 1]], rows
+
+
+def _scan(mesh, matrix_world, region, rv3d, mouse):
+    starts, ends, rows = _project(mesh, matrix_world, region, rv3d)
+    hit = nearest_segment(mouse.x, mouse.y, starts, ends, rows, PICK_RADIUS_PX)
+    return None if hit is None else hit[0]
+
+
+def _build_grid(mesh, matrix_world, region, rv3d):
+    starts, ends, rows = _project(mesh, matrix_world, region, rv3d)
+    bounds = (-PICK_RADIUS_PX, -PICK_RADIUS_PX, region.width + PICK_RADIUS_PX, region.height + PICK_RADIUS_PX)
+    return ScreenSegmentGrid(PICK_RADIUS_PX, starts, ends, rows, bounds=bounds)
+
+
+def _grid_query(grid, mouse):
+    hit = grid.nearest(mouse.x, mouse.y, PICK_RADIUS_PX)
+    return None if hit is None else hit[0]
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    counts = [int(arg) for arg in argv] or [10_000, 100_000]
+
+    matrix_world = Matrix.Identity(4)
+    region, rv3d = make_view()
+
+    for count in counts:
+        mesh = _make_mesh(count)
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bm.edges.index_update()
+
+        # Aim at the middle of an edge so every path has something to find.
+        starts, ends, _ = _project(mesh, matrix_world, region, rv3d)
+        target = (starts[len(starts) // 2] + ends[len(ends) // 2]) / 2.0
+        mouse = Vector((float(target[0]) + 2.0, float(target[1]) + 1.0))
+
+        old_time, old_hit = best_of(_old_loop, bm, matrix_world, region, rv3d, mouse, repeat=3)
+        scan_time, scan_hit = best_of(_scan, mesh, matrix_world, region, rv3d, mouse)
+        build_time, grid = best_of(_build_grid, mesh, matrix_world, region, rv3d)
+        query_time, grid_hit = best_of(_grid_query, grid, mouse, repeat=20)
+        print(
+            f"{count:>8} edges | loop {old_time * 1000.0:9.2f} ms | scan {scan_time * 1000.0:8.2f} ms"
+            f" | grid build {build_time * 1000.0:8.2f} ms, click {query_time * 1000.0:6.3f} ms"
+            f" | same hit: {old_hit == scan_hit == grid_hit}"
+        )
+
+        bm.free()
+        bpy.data.meshes.remove(mesh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The core modules import under plain CPython; make ``addon_package`` importable from the repo root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
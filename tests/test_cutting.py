@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from addon_package.core.cutting import EPSILON, CuttingEdges, interior_cuts
+
+
+class _Vert:
+    def __init__(self, co):
+        self.co = np.asarray(co, dtype=np.float64)
+
+
+class _Edge:
+    def __init__(self, start, end):
+        self.verts = (_Vert(start), _Vert(end))
+        self.is_valid = True
+
+
+class _Matrix:
+    """Stands in for ``obj.matrix_world``: ``matrix @ co`` applies the affine transform."""
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def __matmul__(self, co):
+        return self.matrix[:3, :3] @ co + self.matrix[:3, 3]
+
+
+def _intersect_line_line(a1, a2, b1, b2):
+    """Closest points of two infinite lines, like ``mathutils.geometry.intersect_line_line``."""
+    d1, d2, r = a2 - a1, b2 - b1, a1 - b1
+    a, b, c, e, f = d1 @ d1, d1 @ d2, d1 @ r, d2 @ d2, d2 @ r
+    denom = a * e - b * b
+    if abs(denom) < 1e-12:
+        return None
+    s = (b * f - c * e) / denom
+    t = (a * f - b * c) / denom
+    return a1 + s * d1, b1 + t * d2
+
+
+def _length_sq(v):
+    return float(v @ v)
+
+
+def _old_crossings(edge, cutting_edges, matrix):
+    """The old per-pair ``_get_intersection_point`` loop, sorted by the factor along ``edge``."""
+    e1_v1, e1_v2 = (matrix @ vert.co for vert in edge.verts)
+    found = []
+    for cutting in cutting_edges:
+        if cutting is edge:
+            continue
+        e2_v1, e2_v2 = (matrix @ vert.co for vert in cutting.verts)
+        closest = _intersect_line_line(e1_v1, e1_v2, e2_v1, e2_v2)
+        if closest is None:
+            continue
+        p1, p2 = closest
+        if _length_sq(p1 - p2) < EPSILON:
+            on_1 = _length_sq(p1 - e1_v1) + _length_sq(p1 - e1_v2) <= _length_sq(e1_v1 - e1_v2) + EPSILON
+            on_2 = _length_sq(p1 - e2_v1) + _length_sq(p1 - e2_v2) <= _length_sq(e2_v1 - e2_v2) + EPSILON
+            if on_1 and on_2:
+                edge_vec = e1_v2 - e1_v1
+                found.append(((p1 - e1_v1) @ edge_vec / (edge_vec @ edge_vec), p1))
+    return sorted(found, key=lambda item: item[0])
+
+
+def _random_edges(rng, count):
+    starts = rng.uniform(-10.0, 10.0, size=(count, 3))
+    ends = starts + rng.normal(0.0, 3.0, size=(count, 3))
+    # Most edges lie in one plane so they really cross; the rest pass well above or below.
+    lifted = rng.random(count) < 0.2
+    starts[:, 2] = ends[:, 2] = np.where(lifted, rng.choice((-1.0, 1.0), size=count), 0.0)
+    return [_Edge(start, end) for start, end in zip(starts, ends)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_crossings_match_old_per_pair_test(seed):
+    rng = np.random.default_rng(seed)
+    affine = np.eye(4)
+    affine[:3, :3] = rng.normal(size=(3, 3))
+    affine[:3, 3] = rng.normal(size=3)
+    matrix = _Matrix(affine)
+    cutting_edges = _random_edges(rng, 200)
+    cutting = CuttingEdges(cutting_edges, matrix)
+
+    total = 0
+    for edge in _random_edges(rng, 60) + cutting_edges[:20]:
+        expected = _old_crossings(edge, cutting_edges, matrix)
+        start, end = (matrix @ vert.co for vert in edge.verts)
+        found = cutting.crossings(start, end, skip=edge)
+        assert len(found) == len(expected)
+        for (t, point), (old_t, old_point) in zip(found, expected):
+            assert t == pytest.approx(old_t, abs=1e-9)
+            assert np.allclose(point, old_point, atol=1e-9)
+        total += len(found)
+    assert total > 0
+
+
+def test_refresh_follows_an_edited_and_a_deleted_cutting_edge():
+    matrix = _Matrix(np.eye(4))
+    moved = _Edge((0.0, -1.0, 0.0), (0.0, 1.0, 0.0))
+    deleted = _Edge((1.0, -1.0, 0.0), (1.0, 1.0, 0.0))
+    cutting = CuttingEdges([moved, deleted], matrix)
+    start, end = np.array((-2.0, 0.0, 0.0)), np.array((2.0, 0.0, 0.0))
+    assert [t for t, _ in cutting.crossings(start, end)] == pytest.approx([0.5, 0.75])
+
+    moved.verts[1].co = np.array((0.0, -0.5, 0.0))
+    deleted.is_valid = False
+    cutting.refresh(moved, matrix)
+    cutting.refresh(deleted, matrix)
+    assert cutting.crossings(start, end) == []
+    assert deleted not in cutting and len(cutting) == 1
+
+
+def test_interior_cuts_drop_ends_and_repeats():
+    crossings = [(0.0, "a"), (0.3, "b"), (0.3 + 1e-9, "c"), (0.7, "d"), (1.0, "e")]
+    assert interior_cuts(crossings) == [(0.3, "b"), (0.7, "d")]
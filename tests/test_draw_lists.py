@@ -0,0 +1,43 @@
+from addon_package.core.draw_lists import DrawListCache, line_preview_coords, stroke_preview_coords
+
+
+def test_line_preview_needs_both_ends():
+    assert line_preview_coords(None, (1.0, 2.0, 3.0)) is None
+    assert line_preview_coords((0.0, 0.0, 0.0), None) is None
+    assert line_preview_coords([0.0, 0.0, 0.0], [1.0, 2.0, 3.0]) == [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0)]
+
+
+def test_stroke_preview_lists_segments_then_rubber_band():
+    segments = (((0.0, 0.0, 0.0), (1.0, 0.0, 0.0)), ((1.0, 0.0, 0.0), (1.0, 1.0, 0.0)))
+    assert stroke_preview_coords(segments, [1.0, 1.0, 0.0], [2.0, 1.0, 0.0]) == [
+        (0.0, 0.0, 0.0), (1.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0), (1.0, 1.0, 0.0),
+        (1.0, 1.0, 0.0), (2.0, 1.0, 0.0),
+    ]
+    assert stroke_preview_coords(segments, None, None) == [
+        (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0),
+    ]
+    assert stroke_preview_coords((), (0.0, 0.0, 0.0), None) is None
+
+
+def test_cache_rebuilds_only_when_an_input_changes():
+    calls = []
+
+    def builder(segments, start, end):
+        calls.append((segments, start, end))
+        return stroke_preview_coords(segments, start, end)
+
+    cache = DrawListCache(builder)
+    end = [1.0, 0.0, 0.0]
+    assert cache.update((), (0.0, 0.0, 0.0), end)
+    assert cache.coords == [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)]
+    assert not cache.update((), (0.0, 0.0, 0.0), [1.0, 0.0, 0.0])
+    assert len(calls) == 1
+
+    # A mutable input is compared by value, so changing it in place is seen.
+    end[1] = 2.0
+    assert cache.update((), (0.0, 0.0, 0.0), end)
+    assert cache.coords == [(0.0, 0.0, 0.0), (1.0, 2.0, 0.0)]
+    assert cache.update((), None, end)
+    assert cache.coords is None
+    assert len(calls) == 3
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from addon_package.geom import (
+    apply_axis_constraint,
+    closest_points_on_segments,
+    intersect_lines_plane,
+    point_segment_distance_sq,
+    project_to_region,
+    segment_crossings,
+    segment_intersections_2d,
+    transform_points,
+)
+
+
+def _random_affine(rng):
+    matrix = np.eye(4)
+    matrix[:3, :3] = rng.normal(size=(3, 3))
+    matrix[:3, 3] = rng.normal(size=3)
+    return matrix
+
+
+def test_transform_points_matches_per_point_product():
+    rng = np.random.default_rng(0)
+    matrix = _random_affine(rng)
+    points = rng.normal(size=(50, 3))
+    expected = [(matrix @ np.append(p, 1.0))[:3] for p in points]
+    assert np.allclose(transform_points(points, matrix), expected)
+
+
+def test_project_to_region_matches_per_point_projection():
+    rng = np.random.default_rng(1)
+    matrix = rng.normal(size=(4, 4))
+    coords = rng.normal(size=(200, 3)).astype(np.float32)
+    xy, valid = project_to_region(coords, matrix, 800, 600)
+    for co, point, ok in zip(coords, xy, valid):
+        clip = matrix @ np.append(co, 1.0)
+        assert ok == (clip[3] > 0.0)
+        if ok:
+            expected = (400.0 + 400.0 * clip[0] / clip[3], 300.0 + 300.0 * clip[1] / clip[3])
+            assert np.allclose(point, expected, rtol=1e-4, atol=1e-2)
+
+
+def test_closest_points_on_segments_clamps_and_handles_points():
+    starts = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    ends = np.array([[2.0, 0.0, 0.0], [2.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    points = np.array([[1.0, 1.0, 0.0], [-3.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+    closest, t = closest_points_on_segments(points, starts, ends)
+    assert np.allclose(t, [0.5, 0.0, 0.0])
+    assert np.allclose(closest, [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    assert np.allclose(point_segment_distance_sq(points, starts, ends), [1.0, 9.0, 3.0])
+
+
+def test_segment_crossings_single_query():
+    starts = np.array([[0.0, -1.0, 0.0], [0.0, -1.0, 1.0], [5.0, 0.0, 0.0]])
+    ends = np.array([[0.0, 1.0, 0.0], [0.0, 1.0, 1.0], [6.0, 0.0, 0.0]])
+    t, u, dist = segment_crossings((-1.0, 0.0, 0.0), (1.0, 0.0, 0.0), starts, ends)
+    assert np.allclose(t[:2], [0.5, 0.5]) and np.allclose(u[:2], [0.5, 0.5])
+    assert np.allclose(dist[:2], [0.0, 1.0])
+    # Parallel to the query segment.
+    assert np.isnan(t[2]) and np.isnan(u[2])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_segment_crossings_batch_matches_single_queries(seed):
+    rng = np.random.default_rng(seed)
+    queries = rng.normal(size=(100, 2, 3))
+    starts, ends = rng.normal(size=(2, 100, 3))
+    t, u, dist = segment_crossings(queries[:, 0], queries[:, 1], starts, ends)
+    assert t.shape == u.shape == dist.shape == (100,)
+    for i in range(100):
+        single = segment_crossings(queries[i, 0], queries[i, 1], starts[i:i + 1], ends[i:i + 1])
+        assert np.allclose((t[i], u[i], dist[i]), [value[0] for value in single])
+
+
+def test_segment_intersections_2d_single_query():
+    starts = np.array([[0.0, -1.0], [2.0, -1.0], [0.0, 1.0], [0.5, 0.0]])
+    ends = np.array([[0.0, 1.0], [2.0, 1.0], [1.0, 1.0], [0.5, 2.0]])
+    s, u, hit = segment_intersections_2d((-1.0, 0.0), (1.0, 0.0), starts, ends)
+    # Crossing, beyond the query end, parallel, and touching at the segment start.
+    assert hit.tolist() == [True, False, False, True]
+    assert np.allclose(s[[0, 3]], [0.5, 0.75]) and np.allclose(u[[0, 3]], [0.5, 0.0])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_segment_intersections_2d_batch_matches_single_queries(seed):
+    rng = np.random.default_rng(seed)
+    queries = rng.normal(size=(200, 2, 2))
+    starts, ends = rng.normal(size=(2, 200, 2))
+    s, u, hit = segment_intersections_2d(queries[:, 0], queries[:, 1], starts, ends)
+    assert hit.any() and not hit.all()
+    for i in range(200):
+        single = segment_intersections_2d(queries[i, 0], queries[i, 1], starts[i:i + 1], ends[i:i + 1])
+        assert hit[i] == single[2][0]
+        assert np.allclose((s[i], u[i]), (single[0][0], single[1][0]))
+
+
+def test_intersect_lines_plane():
+    origins = np.array([[0.0, 0.0, 5.0], [1.0, 2.0, 3.0]])
+    directions = np.array([[0.0, 0.0, -2.0], [1.0, 0.0, 0.0]])
+    points, hit = intersect_lines_plane(origins, directions, (0.0, 0.0, 1.0), (0.0, 0.0, 1.0))
+    assert hit.tolist() == [True, False]
+    assert np.allclose(points[0], [0.0, 0.0, 1.0])
+
+
+def test_apply_axis_constraint():
+    points = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    start = (10.0, 20.0, 30.0)
+    assert np.allclose(apply_axis_constraint(points, start, 1, exclude=False), [[10.0, 2.0, 30.0], [10.0, 5.0, 30.0]])
+    assert np.allclose(apply_axis_constraint(points, start, 1, exclude=True), [[1.0, 20.0, 3.0], [4.0, 20.0, 6.0]])
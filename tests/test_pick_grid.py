@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from addon_package.core.mesh_arrays import renumbered_rows
+from addon_package.core.pick_grid import ScreenSegmentGrid, crossing_segments, nearest_segment
+
+
+RADIUS = 10.0
+BOUNDS = (-RADIUS, -RADIUS, 800.0 + RADIUS, 600.0 + RADIUS)
+
+
+def _random_segments(rng, count):
+    starts = rng.uniform(-100.0, 900.0, size=(count, 2)).astype(np.float32)
+    ends = (starts + rng.normal(0.0, 30.0, size=(count, 2))).astype(np.float32)
+    return starts, ends
+
+
+def _old_pick_loop(x, y, starts, ends, ids, radius):
+    """The trim tool's old per-edge scan in id order: closest point on each screen edge, first strictly closer wins."""
+    best = None
+    best_dist_sq = float("inf")
+    for index in np.argsort(ids, kind="stable"):
+        a = starts[index].astype(np.float64)
+        ab = ends[index].astype(np.float64) - a
+        length_sq = float(ab @ ab)
+        t = 0.0 if length_sq == 0.0 else min(1.0, max(0.0, float((np.array((x, y)) - a) @ ab) / length_sq))
+        delta = a + t * ab - (x, y)
+        dist_sq = float(delta @ delta)
+        if dist_sq < best_dist_sq and dist_sq < radius * radius:
+            best, best_dist_sq = int(ids[index]), dist_sq
+    return best, best_dist_sq
+
+
+def _random_view(rng, count):
+    starts, ends = _random_segments(rng, count)
+    # Duplicates under other ids make exact ties, which go to the lowest id.
+    dup = rng.choice(count, size=count // 20, replace=False)
+    starts = np.concatenate((starts, starts[dup]))
+    ends = np.concatenate((ends, ends[dup]))
+    ids = rng.permutation(len(starts)).astype(np.int64)
+    return starts, ends, ids
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_nearest_matches_old_pick_loop(seed):
+    rng = np.random.default_rng(seed)
+    starts, ends, ids = _random_view(rng, 1000)
+    grid = ScreenSegmentGrid(RADIUS, starts, ends, ids, bounds=BOUNDS)
+
+    for x, y in rng.uniform((0.0, 0.0), (800.0, 600.0), size=(60, 2)):
+        expected, expected_dist_sq = _old_pick_loop(x, y, starts, ends, ids, RADIUS)
+        for hit in (nearest_segment(x, y, starts, ends, ids, RADIUS), grid.nearest(x, y, RADIUS)):
+            if hit is None or expected is None or hit[0] != expected:
+                # Only float32 rounding may pick another edge, at the radius or between near ties.
+                hit_dist_sq = RADIUS * RADIUS if hit is None else hit[1]
+                assert abs(hit_dist_sq - min(expected_dist_sq, RADIUS * RADIUS)) < 1e-2
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_crossing_matches_per_segment_loop(seed):
+    rng = np.random.default_rng(seed)
+    starts, ends, ids = _random_view(rng, 1000)
+    grid = ScreenSegmentGrid(RADIUS, starts, ends, ids, bounds=BOUNDS)
+
+    for start, end in rng.uniform((0.0, 0.0), (800.0, 600.0), size=(10, 2, 2)):
+        expected = {}
+        d = end - start
+        for a, b, segment_id in zip(starts.astype(np.float64), ends.astype(np.float64), ids):
+            e = b - a
+            denom = d[0] * e[1] - d[1] * e[0]
+            if denom == 0.0:
+                continue
+            w = a - start
+            s = (w[0] * e[1] - w[1] * e[0]) / denom
+            u = (w[0] * d[1] - w[1] * d[0]) / denom
+            if 0.0 <= s <= 1.0 and 0.0 <= u <= 1.0:
+                expected[int(segment_id)] = (s, u)
+
+        for found in (crossing_segments(start, end, starts, ends, ids), grid.crossing(start, end)):
+            crossed = {int(i): (s, u) for i, s, u in zip(*found)}
+            assert crossed.keys() == expected.keys()
+            for segment_id, params in crossed.items():
+                assert np.allclose(params, expected[segment_id], atol=1e-6)
+
+
+def test_renumbered_rows_fills_freed_slots_first():
+    # Rows 1 and 4 of six are deleted; the two new elements land in slot 1 and at the end.
+    mapping = renumbered_rows(6, [1, 4], [1, 5], 6)
+    assert mapping.tolist() == [0, -1, 2, 3, -1, 4]
+    assert renumbered_rows(3, [], [3, 4], 5).tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_patched_grid_matches_rebuilt_grid(seed):
+    rng = np.random.default_rng(seed)
+    starts, ends = _random_segments(rng, 3000)
+    rows = np.arange(len(starts), dtype=np.int64)
+    grid = ScreenSegmentGrid(RADIUS, starts, ends, rows, bounds=BOUNDS)
+
+    # Two edits, each replacing 50 segments by 120 new ones, some of them reusing the freed rows.
+    all_starts, all_ends, all_rows = starts, ends, rows
+    for _ in range(2):
+        count = len(all_rows)
+        removed = rng.choice(count, size=50, replace=False)
+        new_starts, new_ends = _random_segments(rng, 120)
+        added = np.concatenate((np.sort(removed)[:30], np.arange(count - 50, count + 40)))
+        mapping = renumbered_rows(count, removed, added, count + 70)
+        grid.renumber(mapping)
+        grid.extend(new_starts, new_ends, added)
+
+        keep = mapping[all_rows] >= 0
+        all_starts = np.concatenate((all_starts[keep], new_starts))
+        all_ends = np.concatenate((all_ends[keep], new_ends))
+        all_rows = np.concatenate((mapping[all_rows[keep]], added))
+    assert len(grid) == len(all_rows)
+    rebuilt = ScreenSegmentGrid(RADIUS, all_starts, all_ends, all_rows, bounds=BOUNDS)
+
+    for x, y in rng.uniform((0.0, 0.0), (800.0, 600.0), size=(200, 2)):
+        expected = nearest_segment(x, y, all_starts, all_ends, all_rows, RADIUS)
+        assert grid.nearest(x, y, RADIUS) == rebuilt.nearest(x, y, RADIUS) == expected
+    for start, end in rng.uniform((0.0, 0.0), (800.0, 600.0), size=(20, 2, 2)):
+        expected = crossing_segments(start, end, all_starts, all_ends, all_rows)
+        ids, _, _ = grid.crossing(start, end)
+        assert sorted(ids.tolist()) == sorted(expected[0].tolist())
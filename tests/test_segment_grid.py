@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from addon_package.core.segment_grid import SegmentGrid, plan_splits
+
+
+def _chain_pieces(plan, end_rows):
+    """Undirected pieces the commit chains through each segment, rows as ``("row", r)`` and points as ``("point", p)``."""
+    pieces = []
+    for (row_a, row_b), cuts in zip(end_rows, plan.segment_cuts):
+        chain = [("row", row_a), *(("point", point) for _, point in cuts), ("row", row_b)]
+        pieces.extend(frozenset(pair) for pair in zip(chain, chain[1:]))
+    return pieces
+
+
+def test_segments_drawn_back_over_a_crossing_share_its_split_point():
+    # Edge E along X; A -> B crosses it at P, then B -> C runs back down the same line past P.
+    grid = SegmentGrid(np.array([[-1.0, 0.0, 0.0]]), np.array([[1.0, 0.0, 0.0]]))
+    segments = np.array([[[0.0, -1.0, 0.0], [0.0, 1.0, 0.0]], [[0.0, 1.0, 0.0], [0.0, -0.5, 0.0]]])
+    end_rows = np.array([[10, 11], [11, 12]])
+    plan = plan_splits(grid, segments, np.ones((2, 2), dtype=bool), end_rows)
+
+    assert plan.points == [((0.0, 0.0, 0.0), None)]
+    assert plan.edge_cuts == {0: [(0.5, 0)]}
+    assert [[point for _, point in cuts] for cuts in plan.segment_cuts] == [[0], [0]]
+
+    # Both chains run through P and B, so the commit must not create B-P twice.
+    pieces = _chain_pieces(plan, end_rows.tolist())
+    assert len(pieces) == 4
+    assert len(set(pieces)) == 3
+
+
+def test_coincident_buffered_vertices_on_an_edge_make_one_cut():
+    # Two strokes end on the same point of the edge, at different buffered rows.
+    grid = SegmentGrid(np.array([[0.0, 0.0, 0.0]]), np.array([[2.0, 0.0, 0.0]]))
+    segments = np.array([[[0.5, 1.0, 0.0], [0.5, 0.0, 0.0]], [[0.5, -1.0, 0.0], [0.5, 0.0, 0.0]]])
+    end_rows = np.array([[2, 3], [4, 5]])
+    plan = plan_splits(grid, segments, np.ones((2, 2), dtype=bool), end_rows)
+
+    assert len(plan.points) == 1 and plan.points[0][1] in (3, 5)
+    assert plan.edge_cuts == {0: [(0.25, 0)]}
+
+
+def _assert_plan_is_consistent(plan, grid, segments, end_rows, tolerance):
+    used = set()
+    cut_lists = [(cuts, *grid.endpoints(row)) for row, cuts in plan.edge_cuts.items()]
+    cut_lists += [(cuts, start, end) for cuts, (start, end) in zip(plan.segment_cuts, segments)]
+    for cuts, start, end in cut_lists:
+        params = [param for param, _ in cuts]
+        assert all(0.0 < param < 1.0 for param in params)
+        assert all(a < b for a, b in zip(params, params[1:]))
+        for param, point in cuts:
+            used.add(point)
+            assert np.linalg.norm(start + param * (end - start) - plan.points[point][0]) <= 2.0 * tolerance
+    # Every point splits something, and buffered points keep a row of the stroke.
+    assert used == set(range(len(plan.points)))
+    assert {row for _, row in plan.points if row is not None} <= set(end_rows.ravel().tolist())
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_plan_splits_properties_on_random_strokes(seed):
+    rng = np.random.default_rng(seed)
+    # Edges and strokes on a coarse lattice so that ends land on edges and crossings coincide.
+    edge_points = rng.integers(0, 6, size=(40, 2, 3)).astype(np.float64) / 2.0
+    edge_points[:, :, 2] = 0.0
+    grid = SegmentGrid(edge_points[:, 0], edge_points[:, 1])
+    verts = rng.integers(0, 6, size=(12, 3)).astype(np.float64) / 2.0
+    verts[:, 2] = 0.0
+    verts[rng.integers(0, 12, size=3)] = verts[rng.integers(0, 12, size=3)]
+    rows = 100 + np.arange(len(verts))
+    segments = np.stack((verts[:-1], verts[1:]), axis=1)
+    end_rows = np.stack((rows[:-1], rows[1:]), axis=1)
+    ends_new = rng.random(end_rows.shape) < 0.8
+
+    plan = plan_splits(grid, segments, ends_new, end_rows)
+    _assert_plan_is_consistent(plan, grid, segments, end_rows, 1e-4)
@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from addon_package.core.snap_grid import GridBuildJob, ScreenGrid
+from addon_package.core.snap_index import CHUNK_SIZE, SnapTargets
+
+
+RADIUS = 10.0
+
+
+def _linear_scan(points, ids, x, y, radius):
+    """The per-candidate loop the grid replaces: strictly inside ``radius``, first strictly closer in id order wins."""
+    delta = points - np.array((x, y), dtype=np.float32)
+    dist = np.hypot(delta[:, 0], delta[:, 1])
+    best = None
+    for index in np.argsort(ids, kind="stable"):
+        if dist[index] < radius and (best is None or dist[index] < dist[best]):
+            best = index
+    if best is None:
+        return None
+    return int(ids[best]), float(points[best, 0]), float(points[best, 1])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_matches_linear_scan_on_random_points(seed):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-50.0, 1970.0, size=(5000, 2)).astype(np.float32)
+    ids = rng.permutation(len(points)).astype(np.int64)
+    grid = ScreenGrid(RADIUS, points, ids)
+
+    for x, y in rng.uniform(0.0, 1920.0, size=(300, 2)):
+        assert grid.nearest(x, y, RADIUS) == _linear_scan(points, ids, x, y, RADIUS)
+
+
+def test_nearest_matches_linear_scan_across_segments_and_tail():
+    rng = np.random.default_rng(7)
+    points = rng.integers(0, 400, size=(3000, 2)).astype(np.float32)
+    ids = np.arange(len(points), dtype=np.int64)
+    grid = ScreenGrid(RADIUS, points[:1000], ids[:1000])
+    grid.extend(points[1000:2900], ids[1000:2900])
+    for candidate_id, (x, y) in zip(ids[2900:], points[2900:]):
+        grid.add(int(candidate_id), float(x), float(y))
+
+    for x, y in rng.integers(0, 400, size=(300, 2)).astype(float):
+        assert grid.nearest(x, y, RADIUS) == _linear_scan(points, ids, x, y, RADIUS)
+    grid.compact()
+    for x, y in rng.integers(0, 400, size=(300, 2)).astype(float):
+        assert grid.nearest(x, y, RADIUS) == _linear_scan(points, ids, x, y, RADIUS)
+
+
+def test_candidate_on_the_radius_is_excluded():
+    points = np.array([[110.0, 100.0], [100.0, 90.0], [106.0, 108.0]], dtype=np.float32)
+    ids = np.array([0, 1, 2], dtype=np.int64)
+    grid = ScreenGrid(RADIUS, points, ids)
+
+    # All three lie exactly ``RADIUS`` away (6-8-10 for the last one).
+    assert grid.nearest(100.0, 100.0, RADIUS) is None
+    assert _linear_scan(points, ids, 100.0, 100.0, RADIUS) is None
+    assert grid.nearest(100.0, 100.0, RADIUS + 1e-3)[0] == 0
+
+
+def test_ties_go_to_the_lowest_id():
+    # Same distance from (100, 100), inserted with the higher ids first and in different cells.
+    points = np.array([[103.0, 104.0], [96.0, 97.0], [104.0, 97.0], [97.0, 104.0]], dtype=np.float32)
+    ids = np.array([9, 4, 7, 5], dtype=np.int64)
+    grid = ScreenGrid(RADIUS, points, ids)
+    assert grid.nearest(100.0, 100.0, RADIUS) == _linear_scan(points, ids, 100.0, 100.0, RADIUS) == (4, 96.0, 97.0)
+
+    grid.add(2, 100.0, 95.0)
+    assert grid.nearest(100.0, 100.0, RADIUS) == (2, 100.0, 95.0)
+    assert grid.nearest(100.0, 100.0, 5.0) is None
+
+
+def _perspective_matrix(rng, width, height):
+    """A random look-at view times an OpenGL-style projection, like ``rv3d.perspective_matrix``."""
+    eye = rng.uniform(-20.0, 20.0, size=3)
+    forward = rng.uniform(-5.0, 5.0, size=3) - eye
+    forward /= np.linalg.norm(forward)
+    right = np.cross(forward, (0.0, 0.0, 1.0))
+    right /= np.linalg.norm(right)
+    up = np.cross(right, forward)
+    view = np.eye(4)
+    view[0, :3], view[1, :3], view[2, :3] = right, up, -forward
+    view[:3, 3] = -view[:3, :3] @ eye
+
+    near, far = 0.1, 200.0
+    focal = 1.0 / np.tan(np.radians(rng.uniform(30.0, 90.0)) / 2.0)
+    projection = np.zeros((4, 4))
+    projection[0, 0] = focal * height / width
+    projection[1, 1] = focal
+    projection[2, 2] = (far + near) / (near - far)
+    projection[2, 3] = 2.0 * far * near / (near - far)
+    projection[3, 2] = -1.0
+    return projection @ view
+
+
+def _location_3d_to_region_2d(co, matrix, width, height):
+    """Per-vertex projection as ``view3d_utils.location_3d_to_region_2d`` does it; None behind the view."""
+    clip = matrix @ np.append(co, 1.0)
+    if clip[3] <= 0.0:
+        return None
+    return width / 2.0 + width / 2.0 * clip[0] / clip[3], height / 2.0 + height / 2.0 * clip[1] / clip[3]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_build_job_matches_per_vertex_projection(seed):
+    rng = np.random.default_rng(seed)
+    width, height = 1280, 720
+    # Walk-like points so the chunks are spatially coherent and the frustum test culls some of them.
+    coords = np.cumsum(rng.normal(0.0, 1.0, size=(6 * CHUNK_SIZE, 3)), axis=0)
+    coords -= coords.mean(axis=0)
+    visible = rng.random(len(coords)) > 0.1
+    targets = SnapTargets(coords.astype(np.float32), visible)
+    matrix = _perspective_matrix(rng, width, height)
+
+    job = GridBuildJob(targets, matrix, width, height, (width / 2.0, height / 2.0), RADIUS)
+    while not job.done:
+        job.step(deadline=0.0)
+
+    rows = []
+    points = []
+    for row, co in enumerate(targets.coords.astype(np.float64)):
+        screen = _location_3d_to_region_2d(co, matrix, width, height) if visible[row] else None
+        if screen is not None:
+            rows.append(row)
+            points.append(screen)
+    rows = np.array(rows, dtype=np.int64)
+    points = np.array(points, dtype=np.float32).reshape(-1, 2)
+
+    on_screen = points[(points >= 0.0).all(axis=1) & (points <= (width, height)).all(axis=1)]
+    near_points = on_screen[rng.integers(0, len(on_screen), size=min(len(on_screen), 60))]
+    cursors = np.concatenate((
+        near_points + rng.normal(0.0, 4.0, size=near_points.shape),
+        rng.uniform((0.0, 0.0), (width, height), size=(40, 2)),
+    ))
+    for x, y in cursors:
+        hit = job.grid.nearest(x, y, RADIUS)
+        expected = _linear_scan(points, rows, x, y, RADIUS)
+        hit_dist = RADIUS if hit is None else np.hypot(x - hit[1], y - hit[2])
+        expected_dist = RADIUS if expected is None else np.hypot(x - expected[1], y - expected[2])
+        assert abs(hit_dist - expected_dist) < 1e-3
+        if (hit or (None,))[0] != (expected or (None,))[0]:
+            # Only float32 rounding may pick another candidate, at the radius or between near ties.
+            assert min(hit_dist, expected_dist) > RADIUS - 1e-3 or abs(hit_dist - expected_dist) < 1e-4
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from addon_package.core.segment_grid import SegmentGrid
+from addon_package.core.weld import WeldGrid, weld_map
+
+
+def _brute_weld_map(coords, distance):
+    """Transitive groups of vertices within ``distance``, each merged into its lowest index."""
+    count = len(coords)
+    labels = np.arange(count)
+    dist = np.linalg.norm(coords[:, None, :] - coords[None, :, :], axis=2)
+    pairs = np.argwhere(dist <= distance)
+    changed = True
+    while changed:
+        low = np.minimum(labels[pairs[:, 0]], labels[pairs[:, 1]])
+        updated = labels.copy()
+        np.minimum.at(updated, pairs[:, 0], low)
+        changed = not np.array_equal(updated, labels)
+        labels = updated
+    return labels
+
+
+@pytest.mark.parametrize("offset", [0.0, 5e5])
+def test_weld_map_matches_brute_force(offset):
+    rng = np.random.default_rng(3)
+    coords = rng.uniform(0.0, 2.0, size=(1500, 3)) + offset
+    # Near-duplicates, including a chain whose ends are further apart than the distance.
+    coords[100] = coords[7] + 4e-4
+    coords[200] = coords[100] + 4e-4
+    coords[300] = coords[40]
+    assert np.array_equal(weld_map(coords, 5e-4), _brute_weld_map(coords, 5e-4))
+
+
+def test_weld_map_over_a_large_extent_with_a_fine_distance():
+    # 1e-4 welding over a kilometre used to clamp almost every vertex into the border cells.
+    rng = np.random.default_rng(5)
+    coords = rng.uniform(-500.0, 500.0, size=(20000, 3))
+    coords[19999] = coords[12] + 5e-5
+    target = weld_map(coords, 1e-4)
+    expected = np.arange(len(coords))
+    expected[19999] = 12
+    assert np.array_equal(target, expected)
+
+
+def test_weld_grid_far_from_the_origin():
+    rng = np.random.default_rng(11)
+    coords = rng.uniform(0.0, 1000.0, size=(5000, 3)) + 5e5
+    grid = WeldGrid(1e-4, coords, np.arange(len(coords)))
+    assert grid.find(coords[42] + 5e-5) == 42
+    assert grid.find(coords[42] + 2e-4) is None
+    grid.add(5000, coords[42] + 1e-5)
+    assert grid.find(coords[42] + 1e-5) == 5000
+
+
+def test_segment_grid_far_from_the_origin_keeps_candidates_local():
+    rng = np.random.default_rng(13)
+    starts = rng.uniform(0.0, 1000.0, size=(20000, 3)) + 5e5
+    ends = starts + rng.normal(0.0, 0.05, size=starts.shape)
+    grid = SegmentGrid(starts, ends)
+    candidates = grid.candidates(starts[0], ends[0])
+    assert 0 in candidates
+    assert len(candidates) < 10